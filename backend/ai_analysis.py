@@ -1,15 +1,26 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Final, FrozenSet, Tuple, TypedDict
+import aiohttp
+import asyncio
+import atexit
+import hashlib
 import os
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 import json
+import orjson
 import re
-from dataclasses import dataclass
-from github_extractor import fetch_github_profile
-from instagram_scraper import InstagramScraper
+from dataclasses import dataclass, asdict
+from github_extractor import fetch_github_profile_async
+from instagram_scraper import InstagramScraperPool, extract_username_from_url
 from web_scraper import scrape_portfolio, PortfolioData
 from resume_parser import parse_resume
+from skill_search import build_skill_automaton, iter_skill_matches
 import google.generativeai as genai
 from dotenv import load_dotenv
+import logging
 import pathlib
 
 # Load environment variables from parent directory
@@ -17,10 +28,21 @@ parent_dir = pathlib.Path(__file__).parent.parent
 env_path = parent_dir / '.env'
 load_dotenv(env_path)
 
+logger = logging.getLogger(__name__)
+
 class AIAnalysisError(Exception):
     pass
 
-@dataclass
+def _json_loads(text: str) -> Any:
+    """Parse JSON text."""
+    return orjson.loads(text)
+
+def write_json(data: Any, filename: str) -> None:
+    """Write data to a JSON file."""
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+@dataclass(slots=True, frozen=True)
 class JobRequirements:
     required_skills: List[str]
     preferred_skills: List[str]
@@ -30,7 +52,7 @@ class JobRequirements:
     min_github_repos: int
     required_education: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CandidateScore:
     overall_score: float
     skill_match_score: float
@@ -43,120 +65,198 @@ class CandidateScore:
     weaknesses: List[str]
     recommendations: List[str]
 
-def normalize_skills(skills: List[str]) -> List[str]:
+# Common technical skills to look for
+COMMON_SKILLS: Final = (
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Ruby", "PHP",
+    "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django", "Flask",
+    "Spring", "Express", "MongoDB", "MySQL", "PostgreSQL", "AWS", "Azure",
+    "GCP", "Docker", "Kubernetes", "Git", "Linux", "Agile", "Scrum", "DevOps",
+    "CI/CD", "REST", "GraphQL", "API"
+)
+
+# All skills as one lowercase alternation so the text is scanned once, longest names first.
+# Text is lowercased before matching, which is cheaper than re.IGNORECASE.
+SKILL_CANONICAL_NAMES = {skill.lower(): skill for skill in COMMON_SKILLS}
+SKILL_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(skill) for skill in sorted(SKILL_CANONICAL_NAMES, key=len, reverse=True)) + r')\b'
+)
+
+# With pyahocorasick installed, one automaton pass finds every skill instead of a
+# regex walk; without it this is None and SKILL_PATTERN is used
+SKILL_AUTOMATON = build_skill_automaton(SKILL_CANONICAL_NAMES)
+
+# Canonical names for common spellings of skills
+SKILL_MAPPING: Final = MappingProxyType({
+    # Programming Languages
+    "python": "Python",
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "java": "Java",
+    "c++": "C++",
+    "c#": "C#",
+    "ruby": "Ruby",
+    "php": "PHP",
+    "go": "Go",
+    "rust": "Rust",
+    "swift": "Swift",
+    "kotlin": "Kotlin",
+    
+    # Web Technologies
+    "html": "HTML",
+    "css": "CSS",
+    "react": "React",
+    "angular": "Angular",
+    "vue": "Vue.js",
+    "node": "Node.js",
+    "express": "Express.js",
+    "django": "Django",
+    "flask": "Flask",
+    "spring": "Spring",
+    "laravel": "Laravel",
+    
+    # Databases
+    "mysql": "MySQL",
+    "postgresql": "PostgreSQL",
+    "mongodb": "MongoDB",
+    "redis": "Redis",
+    "elasticsearch": "Elasticsearch",
+    
+    # Cloud & DevOps
+    "aws": "AWS",
+    "azure": "Azure",
+    "gcp": "GCP",
+    "docker": "Docker",
+    "kubernetes": "Kubernetes",
+    "jenkins": "Jenkins",
+    "git": "Git",
+    "ci/cd": "CI/CD",
+    
+    # Other
+    "agile": "Agile",
+    "scrum": "Scrum",
+    "devops": "DevOps",
+    "rest": "REST",
+    "graphql": "GraphQL",
+    "api": "API"
+})
+
+def _canonical_skills(skills: Iterable[str]) -> Iterator[str]:
+    """Lazily map each skill to its canonical name, keeping duplicates."""
+    return (SKILL_MAPPING.get(skill.lower(), skill) for skill in skills)
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
     """Normalize and standardize skill names."""
-    skill_mapping = {
-        # Programming Languages
-        "python": "Python",
-        "javascript": "JavaScript",
-        "typescript": "TypeScript",
-        "java": "Java",
-        "c++": "C++",
-        "c#": "C#",
-        "ruby": "Ruby",
-        "php": "PHP",
-        "go": "Go",
-        "rust": "Rust",
-        "swift": "Swift",
-        "kotlin": "Kotlin",
-        
-        # Web Technologies
-        "html": "HTML",
-        "css": "CSS",
-        "react": "React",
-        "angular": "Angular",
-        "vue": "Vue.js",
-        "node": "Node.js",
-        "express": "Express.js",
-        "django": "Django",
-        "flask": "Flask",
-        "spring": "Spring",
-        "laravel": "Laravel",
+    # dict.fromkeys removes duplicates in one pass and keeps first-seen order
+    return list(dict.fromkeys(_canonical_skills(skills)))
+
+def extract_skills_from_text(text: str) -> List[str]:
+    """Extract skills from text using common patterns."""
+    text = text.lower()
+    if SKILL_AUTOMATON is not None:
+        found_skills = {SKILL_CANONICAL_NAMES[name] for name in iter_skill_matches(SKILL_AUTOMATON, text)}
+    else:
+        found_skills = {SKILL_CANONICAL_NAMES[match] for match in SKILL_PATTERN.findall(text)}
+    return [skill for skill in COMMON_SKILLS if skill in found_skills]
+
+@lru_cache(maxsize=256)
+def _normalized_skill_set(skills: Tuple[str, ...]) -> FrozenSet[str]:
+    """Normalize a sorted tuple of skills into a frozenset, cached across calls."""
+    return frozenset(normalize_skills(skills))
+
+def _skill_mask(skills: Iterable[str], index: Dict[str, int]) -> int:
+    """Encode skills as a bitmask, ignoring skills outside the index."""
+    mask = 0
+    for skill in skills:
+        bit = index.get(skill)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+def _decode_skill_mask(mask: int, vocabulary: Tuple[str, ...]) -> List[str]:
+    """List the vocabulary skills whose bits are set in mask."""
+    return [skill for bit, skill in enumerate(vocabulary) if mask >> bit & 1]
+
+def _popcount(mask: int) -> int:
+    """Count the set bits in mask."""
+    return bin(mask).count("1")
+
+@lru_cache(maxsize=256)
+def _skill_matcher(job_skills: Tuple[str, ...], preferred_skills: Tuple[str, ...]) -> Callable[[List[str]], Dict[str, Any]]:
+    """Build and cache the matcher for one sorted (job_skills, preferred_skills) pair."""
+    # Index the job's normalized skills as bit positions; the vocabulary is
+    # sorted, so decoded masks come out in sorted order
+    job_set = _normalized_skill_set(job_skills)
+    preferred_set = _normalized_skill_set(preferred_skills)
+    vocabulary = tuple(sorted(job_set | preferred_set))
+    index = {skill: bit for bit, skill in enumerate(vocabulary)}
+    job_mask = _skill_mask(job_set, index)
+    preferred_mask = _skill_mask(preferred_set, index)
+    job_count = _popcount(job_mask)
+    preferred_count = _popcount(preferred_mask)
+    
+    def match(candidate_skills: List[str]) -> Dict[str, Any]:
+        matching_required = []
+        matching_preferred = []
+        missing_required = []
+        required_score = 0
+        preferred_score = 0
         
-        # Databases
-        "mysql": "MySQL",
-        "postgresql": "PostgreSQL",
-        "mongodb": "MongoDB",
-        "redis": "Redis",
-        "elasticsearch": "Elasticsearch",
+        # Nothing to match against, so skip normalizing the candidate's skills
+        if index:
+            # Candidate skills the job doesn't mention can't affect the scores, and
+            # setting a bit twice is harmless, so the skills are streamed without deduplication
+            candidate_mask = _skill_mask(_canonical_skills(candidate_skills), index)
+            
+            # Calculate matches and missing skills
+            required_mask = candidate_mask & job_mask
+            preferred_match_mask = candidate_mask & preferred_mask
+            matching_required = _decode_skill_mask(required_mask, vocabulary)
+            matching_preferred = _decode_skill_mask(preferred_match_mask, vocabulary)
+            missing_required = _decode_skill_mask(job_mask & ~candidate_mask, vocabulary)
+            
+            # Calculate match scores
+            required_score = _popcount(required_mask) / job_count * 100 if job_count else 0
+            preferred_score = _popcount(preferred_match_mask) / preferred_count * 100 if preferred_count else 0
         
-        # Cloud & DevOps
-        "aws": "AWS",
-        "azure": "Azure",
-        "gcp": "GCP",
-        "docker": "Docker",
-        "kubernetes": "Kubernetes",
-        "jenkins": "Jenkins",
-        "git": "Git",
-        "ci/cd": "CI/CD",
+        # Weighted final score (70% required, 30% preferred)
+        final_score = (required_score * 0.7) + (preferred_score * 0.3)
         
-        # Other
-        "agile": "Agile",
-        "scrum": "Scrum",
-        "devops": "DevOps",
-        "rest": "REST",
-        "graphql": "GraphQL",
-        "api": "API"
-    }
-    
-    normalized_skills = []
-    for skill in skills:
-        skill_lower = skill.lower()
-        if skill_lower in skill_mapping:
-            normalized_skills.append(skill_mapping[skill_lower])
-        else:
-            normalized_skills.append(skill)
+        return {
+            "match_score": round(final_score, 2),
+            "required_match_score": round(required_score, 2),
+            "preferred_match_score": round(preferred_score, 2),
+            "matching_required_skills": matching_required,
+            "matching_preferred_skills": matching_preferred,
+            "missing_required_skills": missing_required
+        }
     
-    return list(set(normalized_skills))  # Remove duplicates
+    return match
 
-def extract_skills_from_text(text: str) -> List[str]:
-    """Extract skills from text using common patterns."""
-    # Common technical skills to look for
-    common_skills = [
-        "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Ruby", "PHP",
-        "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django", "Flask",
-        "Spring", "Express", "MongoDB", "MySQL", "PostgreSQL", "AWS", "Azure",
-        "GCP", "Docker", "Kubernetes", "Git", "Linux", "Agile", "Scrum", "DevOps",
-        "CI/CD", "REST", "GraphQL", "API"
-    ]
-    
-    found_skills = []
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-            found_skills.append(skill)
-    
-    return found_skills
+def make_skill_matcher(job_skills: List[str], preferred_skills: List[str]) -> Callable[[List[str]], Dict[str, Any]]:
+    """
+    Build a skill matcher specialized to one job's required and preferred skills.
+    
+    The job's skills are normalized and indexed once, so screening many
+    candidates against the same job only does the per-candidate work.
+    
+    Args:
+        job_skills: Required skills for the job
+        preferred_skills: Preferred skills for the job
+        
+    Returns:
+        Function taking a candidate's skills and returning the skill match analysis
+    """
+    return _skill_matcher(tuple(sorted(job_skills)), tuple(sorted(preferred_skills)))
 
 def calculate_skill_match(candidate_skills: List[str], job_skills: List[str], preferred_skills: List[str]) -> Dict[str, Any]:
     """Calculate skill match between candidate and job requirements."""
-    candidate_skills = normalize_skills(candidate_skills)
-    job_skills = normalize_skills(job_skills)
-    preferred_skills = normalize_skills(preferred_skills)
-    
-    # Calculate matches and missing skills
-    matching_required = [skill for skill in candidate_skills if skill in job_skills]
-    matching_preferred = [skill for skill in candidate_skills if skill in preferred_skills]
-    missing_required = [skill for skill in job_skills if skill not in candidate_skills]
-    
-    # Calculate match scores
-    required_score = len(matching_required) / len(job_skills) * 100 if job_skills else 0
-    preferred_score = len(matching_preferred) / len(preferred_skills) * 100 if preferred_skills else 0
-    
-    # Weighted final score (70% required, 30% preferred)
-    final_score = (required_score * 0.7) + (preferred_score * 0.3)
-    
-    return {
-        "match_score": round(final_score, 2),
-        "required_match_score": round(required_score, 2),
-        "preferred_match_score": round(preferred_score, 2),
-        "matching_required_skills": matching_required,
-        "matching_preferred_skills": matching_preferred,
-        "missing_required_skills": missing_required
-    }
+    # Matchers are cached per job, so repeated calls for one job reuse the same one
+    return make_skill_matcher(job_skills, preferred_skills)(candidate_skills)
 
-def calculate_experience_score(experience: List[Dict], min_years: int) -> float:
-    """Calculate experience score based on years of experience."""
-    total_years = 0
+def _experience_year_ranges(experience: List[Dict]) -> List[Tuple[int, int]]:
+    """Extract (start_year, end_year) pairs from experience date strings."""
+    current_year = datetime.now().year
+    year_ranges = []
     for exp in experience:
         if exp.get('date'):
             # Extract years from date string (assuming format like "2020-2022" or "2020-Present")
@@ -164,10 +264,18 @@ def calculate_experience_score(experience: List[Dict], min_years: int) -> float:
             if len(years) == 2:
                 try:
                     start_year = int(years[0])
-                    end_year = int(years[1]) if years[1].isdigit() else datetime.now().year
-                    total_years += end_year - start_year
                 except ValueError:
                     continue
+                try:
+                    end_year = int(years[1])
+                except ValueError:
+                    end_year = current_year  # Ongoing role, e.g. "Present"
+                year_ranges.append((start_year, end_year))
+    return year_ranges
+
+def calculate_experience_score(experience: List[Dict], min_years: int) -> float:
+    """Calculate experience score based on years of experience."""
+    total_years = sum(end_year - start_year for start_year, end_year in _experience_year_ranges(experience))
     
     # Calculate score (100% if meets or exceeds minimum, otherwise proportional)
     score = min(100, (total_years / min_years) * 100) if min_years > 0 else 100
@@ -202,27 +310,28 @@ def calculate_github_score(github_data: Dict[str, Any], min_stars: int, min_repo
     final_score = (stars_score * 0.4) + (repos_score * 0.3) + (activity_score * 0.3)
     return round(final_score, 2)
 
+# Education levels, ordered from lowest to highest
+EDUCATION_LEVELS: Final = {
+    "high school": 1,
+    "associate": 2,
+    "bachelor": 3,
+    "master": 4,
+    "phd": 5
+}
+
 def calculate_education_score(education: List[Dict], required_education: Optional[str]) -> float:
     """Calculate education score based on required education level."""
     if not required_education:
         return 100
     
-    education_levels = {
-        "high school": 1,
-        "associate": 2,
-        "bachelor": 3,
-        "master": 4,
-        "phd": 5
-    }
-    
-    required_level = education_levels.get(required_education.lower(), 0)
+    required_level = EDUCATION_LEVELS.get(required_education.lower(), 0)
     if required_level == 0:
         return 100
     
     highest_level = 0
     for edu in education:
         degree = edu.get('degree', '').lower()
-        for level, value in education_levels.items():
+        for level, value in EDUCATION_LEVELS.items():
             if level in degree:
                 highest_level = max(highest_level, value)
     
@@ -230,6 +339,14 @@ def calculate_education_score(education: List[Dict], required_education: Optiona
     score = min(100, (highest_level / required_level) * 100)
     return round(score, 2)
 
+def _score_portfolio(portfolio_data: PortfolioData, job_requirements: JobRequirements) -> Tuple[float, float, float]:
+    """Score experience, projects and education from one portfolio in a single call."""
+    return (
+        calculate_experience_score(portfolio_data.experience, job_requirements.min_experience_years),
+        calculate_project_score(portfolio_data.projects, job_requirements.min_projects),
+        calculate_education_score(portfolio_data.education, job_requirements.required_education)
+    )
+
 def evaluate_candidate(
     portfolio_data: PortfolioData,
     github_data: Optional[Dict[str, Any]],
@@ -253,15 +370,7 @@ def evaluate_candidate(
         job_requirements.preferred_skills
     )
     
-    experience_score = calculate_experience_score(
-        portfolio_data.experience,
-        job_requirements.min_experience_years
-    )
-    
-    project_score = calculate_project_score(
-        portfolio_data.projects,
-        job_requirements.min_projects
-    )
+    experience_score, project_score, education_score = _score_portfolio(portfolio_data, job_requirements)
     
     github_score = calculate_github_score(
         github_data,
@@ -269,11 +378,6 @@ def evaluate_candidate(
         job_requirements.min_github_repos
     ) if github_data else 0
     
-    education_score = calculate_education_score(
-        portfolio_data.education,
-        job_requirements.required_education
-    )
-    
     # Calculate overall score (weighted average)
     weights = {
         "skill_match": 0.35,
@@ -348,6 +452,30 @@ def evaluate_candidate(
         recommendations=recommendations
     )
 
+def evaluate_candidates_batch(
+    candidates: List[Tuple[PortfolioData, Optional[Dict[str, Any]], JobRequirements]],
+    max_workers: Optional[int] = None
+) -> List[CandidateScore]:
+    """
+    Evaluate many candidates in parallel worker processes.
+    
+    Args:
+        candidates: (portfolio_data, github_data, job_requirements) tuples
+        max_workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        List of CandidateScore objects in the same order as the input
+    """
+    if len(candidates) < 2:
+        return [evaluate_candidate(*candidate) for candidate in candidates]
+    
+    workers = max_workers or os.cpu_count() or 1
+    # Send candidates in chunks so each worker round trip scores several at once
+    chunksize = max(1, len(candidates) // (workers * 4))
+    portfolios, github_profiles, requirements = zip(*candidates)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(evaluate_candidate, portfolios, github_profiles, requirements, chunksize=chunksize))
+
 def generate_candidate_summary(score: CandidateScore) -> str:
     """Generate a human-readable summary of the candidate evaluation."""
     summary_parts = []
@@ -383,52 +511,141 @@ def generate_candidate_summary(score: CandidateScore) -> str:
     return "\n".join(summary_parts)
 
 # Configure Gemini
-GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
-if not GOOGLE_API_KEY:
-    print("Warning: GOOGLE_API_KEY not found in environment variables")
-    print("Please set your Google API key in the .env file in the web_scraping directory")
-    print("You can get an API key from: https://makersuite.google.com/app/apikey")
-    gemini_model = None
-else:
-    try:
-        genai.configure(api_key=GOOGLE_API_KEY)
-        gemini_model = genai.GenerativeModel('gemini-pro')
-        print("✅ Gemini AI model configured successfully")
-    except Exception as e:
-        print(f"Warning: Gemini configuration failed: {e}")
-        gemini_model = None
+GEMINI_MODEL_NAME = 'gemini-1.5-flash'  # Supports JSON-schema constrained output
 
-def extract_skills_with_gemini(text: str) -> List[str]:
-    """Extract skills from text using Gemini."""
-    if not gemini_model:
-        return extract_skills_from_text(text)  # Fallback to regex-based extraction
-        
-    prompt = f"""
-    Extract technical skills from the following text. Return only a JSON array of skills.
-    Focus on programming languages, frameworks, tools, and technologies.
-    Example output format: ["Python", "React", "AWS"]
-    
-    Text to analyze:
-    {text}
+@lru_cache(maxsize=None)
+def _get_gemini_model() -> Optional[genai.GenerativeModel]:
     """
+    Configure Gemini on first use and return the shared model.
     
+    Returns:
+        The configured model, or None if no API key is set or setup failed
+    """
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        logger.warning(
+            "GOOGLE_API_KEY not found in environment variables. "
+            "Please set your Google API key in the .env file in the web_scraping directory. "
+            "You can get an API key from: https://makersuite.google.com/app/apikey"
+        )
+        return None
     try:
-        response = gemini_model.generate_content(prompt)
-        skills = json.loads(response.text)
-        return skills
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+        logger.info("Gemini AI model configured successfully")
+        return model
     except Exception as e:
-        print(f"Warning: Gemini skill extraction failed: {e}")
-        return extract_skills_from_text(text)  # Fallback to regex-based extraction
+        logger.warning("Gemini configuration failed: %s", e)
+        return None
 
-def match_skills_with_gemini(candidate_skills: List[str], job_skills: List[str]) -> Dict[str, Any]:
-    """Match candidate skills with job requirements using Gemini."""
-    if not gemini_model:
-        return calculate_skill_match(candidate_skills, job_skills, [])  # Fallback to basic matching
+# Gemini response cache: an in-memory LRU backed by one file per prompt on disk
+GEMINI_CACHE_DIR = parent_dir / '.gemini_cache'
+GEMINI_CACHE_SIZE = 1024
+_gemini_cache: "OrderedDict[str, str]" = OrderedDict()
+
+def _gemini_cache_key(prompt: str, response_schema: Any) -> str:
+    """Hash the model name, response schema and prompt into a cache key."""
+    schema_name = response_schema.__name__ if isinstance(response_schema, type) else repr(response_schema)
+    return hashlib.sha256(f"{GEMINI_MODEL_NAME}\n{schema_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+def _remember_gemini_response(key: str, text: str) -> None:
+    """Store a response in the in-memory LRU, evicting the oldest entry."""
+    _gemini_cache[key] = text
+    _gemini_cache.move_to_end(key)
+    if len(_gemini_cache) > GEMINI_CACHE_SIZE:
+        _gemini_cache.popitem(last=False)
+
+def _get_cached_gemini_response(key: str) -> Optional[str]:
+    """Look up a response in memory first, then on disk."""
+    if key in _gemini_cache:
+        _gemini_cache.move_to_end(key)
+        return _gemini_cache[key]
+    try:
+        text = (GEMINI_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    _remember_gemini_response(key, text)
+    return text
+
+def _cache_gemini_response(key: str, text: str) -> None:
+    """Store a response in memory and on disk."""
+    _remember_gemini_response(key, text)
+    try:
+        GEMINI_CACHE_DIR.mkdir(exist_ok=True)
+        (GEMINI_CACHE_DIR / f"{key}.json").write_text(text, encoding="utf-8")
+    except OSError as e:
+        logger.warning("Could not write Gemini cache: %s", e)
+
+# Response schemas for Gemini structured output
+class SkillMatch(TypedDict):
+    match_score: float
+    matching_skills: List[str]
+    missing_skills: List[str]
+    skill_gaps: List[str]
+    recommendations: List[str]
+
+class SkillAnalysis(SkillMatch):
+    extracted_skills: List[str]
+
+async def _generate_json(model: genai.GenerativeModel, prompt: str, response_schema: Any) -> Any:
+    """Send a prompt to Gemini and parse the JSON in its response.
+    
+    Gemini is asked for JSON matching response_schema, so the response text
+    is always valid JSON and needs no cleanup before parsing.
+    """
+    key = _gemini_cache_key(prompt, response_schema)
+    text = _get_cached_gemini_response(key)
+    if text is not None:
+        return _json_loads(text)
+    
+    response = await model.generate_content_async(
+        prompt,
+        generation_config=genai.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=response_schema
+        )
+    )
+    result = _json_loads(response.text)
+    # Only cache responses that parsed, so a bad reply is retried next time
+    _cache_gemini_response(key, response.text)
+    return result
+
+def _fallback_skill_analysis(text: str, job_skills: List[str], candidate_skills: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Regex-based extraction (unless the skills are already known) followed by basic matching."""
+    extracted_skills = candidate_skills if candidate_skills is not None else extract_skills_from_text(text)
+    analysis = calculate_skill_match(extracted_skills, job_skills, [])
+    analysis["extracted_skills"] = extracted_skills
+    return analysis
+
+async def analyze_skills_with_gemini(
+    text: str,
+    job_skills: List[str],
+    candidate_skills: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Extract skills from text and match them against job requirements using a
+    single Gemini call.
+    
+    Args:
+        text: Text to extract skills from
+        job_skills: Required skills for the job
+        candidate_skills: Skills already known for the candidate, matched
+            as-is by the fallback instead of being extracted from text
+        
+    Returns:
+        Dict with the extracted skills and the skill match analysis
+    """
+    model = _get_gemini_model()
+    if not model:
+        return _fallback_skill_analysis(text, job_skills, candidate_skills)
         
     prompt = f"""
-    Compare the candidate's skills with the job requirements and provide a detailed analysis.
+    Extract technical skills from the text below, focusing on programming languages,
+    frameworks, tools, and technologies. Then compare the extracted skills with the
+    job requirements and provide a detailed analysis.
     Return a JSON object with the following structure:
     {{
+        "extracted_skills": List[str],  # Skills found in the text
         "match_score": float,  # Overall match percentage (0-100)
         "matching_skills": List[str],  # Skills that match
         "missing_skills": List[str],  # Required skills that are missing
@@ -436,64 +653,118 @@ def match_skills_with_gemini(candidate_skills: List[str], job_skills: List[str])
         "recommendations": List[str]  # Recommendations for improvement
     }}
 
-    Candidate Skills: {json.dumps(candidate_skills)}
     Job Requirements: {json.dumps(job_skills)}
+    
+    Text to analyze:
+    {text}
     """
     
     try:
-        response = gemini_model.generate_content(prompt)
-        analysis = json.loads(response.text)
-        return analysis
+        return await _generate_json(model, prompt, SkillAnalysis)
     except Exception as e:
-        print(f"Warning: Gemini skill matching failed: {e}")
-        return calculate_skill_match(candidate_skills, job_skills, [])  # Fallback to basic matching
+        logger.warning("Gemini skill analysis failed: %s", e)
+        return _fallback_skill_analysis(text, job_skills, candidate_skills)
 
-def analyze_candidate(
+def _run_skill_analysis(text: str, job_skills: List[str], candidate_skills: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run analyze_skills_with_gemini to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(analyze_skills_with_gemini(text, job_skills, candidate_skills))
+    raise RuntimeError(
+        "The synchronous Gemini skill helpers can't run inside an event loop; "
+        "await analyze_skills_with_gemini instead"
+    )
+
+def extract_skills_with_gemini(text: str) -> List[str]:
+    """Extract skills from text using Gemini. Synchronous; see analyze_skills_with_gemini."""
+    skills = _run_skill_analysis(text, []).get("extracted_skills")
+    if not isinstance(skills, list):
+        return extract_skills_from_text(text)  # Fallback to regex-based extraction
+    return skills
+
+def match_skills_with_gemini(candidate_skills: List[str], job_skills: List[str]) -> Dict[str, Any]:
+    """Match candidate skills with job requirements using Gemini. Synchronous; see analyze_skills_with_gemini."""
+    analysis = _run_skill_analysis(", ".join(candidate_skills), job_skills, candidate_skills)
+    analysis.pop("extracted_skills", None)
+    return analysis
+
+async def _analyze_portfolio_skills(
+    portfolio_url: str,
+    job_requirements: JobRequirements,
+    job_description: Optional[str] = None
+) -> tuple:
+    """Scrape the portfolio, then extract and match its skills in one Gemini call."""
+    # web_scraper's own pooled session carries its retry policy and browser headers
+    portfolio_data = await asyncio.to_thread(scrape_portfolio, portfolio_url)
+    
+    # Build the Gemini input in one join, dropping empty and repeated parts to save tokens
+    parts = [portfolio_data.description, *portfolio_data.skills, job_description]
+    all_text = " ".join(dict.fromkeys(part for part in parts if part))
+    
+    skill_analysis = await analyze_skills_with_gemini(all_text, job_requirements.required_skills)
+    
+    return portfolio_data, skill_analysis
+
+async def _fetch_github_data(
+    github_url: Optional[str],
+    session: Optional[aiohttp.ClientSession] = None
+) -> Optional[Dict[str, Any]]:
+    """Fetch GitHub data if a URL was provided, returning None on failure."""
+    if not github_url:
+        return None
+    try:
+        # Already async, so it runs on the event loop instead of a worker thread
+        return await fetch_github_profile_async(github_url, session)
+    except Exception as e:
+        logger.warning("Could not fetch GitHub data: %s", e)
+        return None
+
+async def _fetch_instagram_data(instagram_handle: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Fetch Instagram data if a handle was provided, returning None on failure."""
+    if not instagram_handle:
+        return None
+    try:
+        username = extract_username_from_url(instagram_handle)
+        profile = _instagram_pool.cached_profile(username)
+        if profile is None:
+            # Wait out the rate limit on the event loop instead of in a worker thread
+            await asyncio.sleep(_instagram_pool.reserve_request())
+            profile = await asyncio.to_thread(_instagram_pool.scrape_profile, username, False)
+        return profile
+    except Exception as e:
+        logger.warning("Could not fetch Instagram data: %s", e)
+        return None
+
+async def analyze_candidate_async(
     portfolio_url: str,
     job_requirements: JobRequirements,
     github_url: Optional[str] = None,
     instagram_handle: Optional[str] = None,
-    job_description: Optional[str] = None
+    job_description: Optional[str] = None,
+    github_session: Optional[aiohttp.ClientSession] = None
 ) -> Dict[str, Any]:
     """
     Analyze a candidate's qualifications based on their portfolio and other data.
     Uses Gemini for skill extraction and matching.
+    
+    The portfolio (and the Gemini calls that depend on it), GitHub and Instagram
+    are independent network round trips, so they run concurrently.
+    
+    When analyzing many candidates, pass one github_session so they share
+    pooled connections to the GitHub API; the caller owns and closes it.
+    Without one, the GitHub fetch opens and closes its own session.
     """
     try:
-        # Scrape portfolio data
-        portfolio_data = scrape_portfolio(portfolio_url)
-        
-        # Extract skills using Gemini
-        all_text = f"{portfolio_data.description} {' '.join(portfolio_data.skills)}"
-        if job_description:
-            all_text += f" {job_description}"
-        
-        extracted_skills = extract_skills_with_gemini(all_text)
-        
-        # Fetch GitHub data if URL provided
-        github_data = None
-        if github_url:
-            try:
-                github_data = fetch_github_profile(github_url)
-            except Exception as e:
-                print(f"Warning: Could not fetch GitHub data: {str(e)}")
-        
-        # Fetch Instagram data if handle provided
-        instagram_data = None
-        if instagram_handle:
-            try:
-                instagram_data = scrape_instagram_profile(instagram_handle)
-            except Exception as e:
-                print(f"Warning: Could not fetch Instagram data: {str(e)}")
-        
-        # Match skills using Gemini
-        skill_analysis = match_skills_with_gemini(extracted_skills, job_requirements.required_skills)
+        (portfolio_data, skill_analysis), github_data, instagram_data = await asyncio.gather(
+            _analyze_portfolio_skills(portfolio_url, job_requirements, job_description),
+            _fetch_github_data(github_url, github_session),
+            _fetch_instagram_data(instagram_handle)
+        )
         
         # Calculate other scores
-        experience_score = calculate_experience_score(portfolio_data.experience, job_requirements.min_experience_years)
-        project_score = calculate_project_score(portfolio_data.projects, job_requirements.min_projects)
+        experience_score, project_score, education_score = _score_portfolio(portfolio_data, job_requirements)
         github_score = calculate_github_score(github_data, job_requirements.min_github_stars, job_requirements.min_github_repos)
-        education_score = calculate_education_score(portfolio_data.education, job_requirements.required_education)
         
         # Calculate overall score
         overall_score = (
@@ -522,29 +793,53 @@ def analyze_candidate(
         summary = generate_candidate_summary(evaluation)
         
         return {
-            "evaluation": evaluation.__dict__,
+            "evaluation": asdict(evaluation),
             "summary": summary,
             "portfolio_data": portfolio_data.__dict__,
             "github_data": github_data,
             "instagram_data": instagram_data,
-            "job_requirements": job_requirements.__dict__,
+            "job_requirements": asdict(job_requirements),
             "timestamp": datetime.now().isoformat()
         }
         
     except Exception as e:
         raise AIAnalysisError(f"Error analyzing candidate: {str(e)}")
 
+def analyze_candidate(
+    portfolio_url: str,
+    job_requirements: JobRequirements,
+    github_url: Optional[str] = None,
+    instagram_handle: Optional[str] = None,
+    job_description: Optional[str] = None
+) -> Dict[str, Any]:
+    """Synchronous wrapper around analyze_candidate_async."""
+    return asyncio.run(analyze_candidate_async(
+        portfolio_url,
+        job_requirements,
+        github_url=github_url,
+        instagram_handle=instagram_handle,
+        job_description=job_description
+    ))
+
+# Recently scraped Instagram profiles are cached by the pool, so repeat lookups skip the browser round trip
+INSTAGRAM_CACHE_TTL = 600  # seconds
+
+# Minimum seconds between Instagram requests, shared by every pooled scraper
+INSTAGRAM_RATE_LIMIT = 5
+
+# Pooled Instagram scrapers, kept alive so WebDriver start-up is paid once per scraper.
+# The pool throttles requests across all of its scrapers.
+_instagram_pool = InstagramScraperPool(rate_limit=INSTAGRAM_RATE_LIMIT, cache_ttl=INSTAGRAM_CACHE_TTL)
+atexit.register(_instagram_pool.close)
+
 def scrape_instagram_profile(username: str) -> Dict[str, Any]:
-    """Helper function to scrape Instagram profile using InstagramScraper class."""
-    scraper = InstagramScraper()
-    try:
-        return scraper.scrape_profile(username)
-    finally:
-        if scraper.driver:
-            scraper.driver.quit()
+    """Helper function to scrape Instagram profile using a pooled InstagramScraper."""
+    return _instagram_pool.scrape_profile(extract_username_from_url(username))
 
 def main():
     """Example usage of the candidate analysis system."""
+    logging.basicConfig(level=logging.INFO)
+    
     # Example job requirements
     requirements = JobRequirements(
         required_skills=["Python", "JavaScript", "React", "Node.js"],
@@ -568,8 +863,7 @@ def main():
         print(results["summary"])
         
         # Save detailed results
-        with open("candidate_analysis.json", "w") as f:
-            json.dump(results, f, indent=2)
+        write_json(results, "candidate_analysis.json")
             
     except Exception as e:
         print(f"Error: {e}")
@@ -1,17 +1,126 @@
+import asyncio
+import orjson
+import aiohttp
 import requests
-from typing import Dict, Any
+import threading
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import LRUCache, TTLCache, cached
+from cachetools.keys import hashkey
+from typing import Dict, Any, List, Optional, Tuple
 import os
 from datetime import datetime
 
 class GitHubAPIError(Exception):
     pass
 
-def fetch_github_profile(username: str) -> Dict[str, Any]:
+# Profiles are looked up repeatedly for the same candidate, so successful
+# responses are kept for a while to save round trips and rate limit
+GITHUB_CACHE_SIZE = 1024
+GITHUB_CACHE_TTL = 600  # seconds
+_profile_cache: TTLCache = TTLCache(maxsize=GITHUB_CACHE_SIZE, ttl=GITHUB_CACHE_TTL)
+_profile_cache_lock = threading.Lock()
+
+# Largest page size the GitHub API allows for list endpoints
+GITHUB_PAGE_SIZE = 100
+
+# Maximum concurrent per-repository requests when fetching language byte counts
+GITHUB_LANGUAGE_CONCURRENCY = 10
+
+# Pooled session for synchronous API calls, so repeat requests to api.github.com
+# reuse the TLS connection; transient failures and rate limits are retried
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+))
+
+# Last ETag and raw body per URL. GitHub answers a matching If-None-Match
+# with an empty 304 that doesn't count against the rate limit. Bodies are
+# kept as bytes and decoded again on a 304, since decoded repository pages
+# take several times the memory, and bounded by total size.
+GITHUB_ETAG_CACHE_BYTES = 32 * 1024 * 1024
+_etag_cache: LRUCache = LRUCache(maxsize=GITHUB_ETAG_CACHE_BYTES, getsizeof=lambda entry: len(entry[1]))
+_etag_cache_lock = threading.Lock()
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body."""
+    return orjson.loads(data)
+
+def _conditional_headers(url: str, headers: Dict[str, str]) -> Tuple[Optional[Tuple[str, bytes]], Dict[str, str]]:
+    """Return the cached (etag, raw body) for url, if any, and headers to revalidate it."""
+    with _etag_cache_lock:
+        cached_response = _etag_cache.get(url)
+    if cached_response is None:
+        return None, headers
+    return cached_response, {**headers, "If-None-Match": cached_response[0]}
+
+def _remember_etag(url: str, etag: Optional[str], body: bytes) -> None:
+    """Store a raw response body under its ETag for later revalidation."""
+    if etag and len(body) <= GITHUB_ETAG_CACHE_BYTES:
+        with _etag_cache_lock:
+            _etag_cache[url] = (etag, body)
+
+async def _get_json(session: aiohttp.ClientSession, url: str, headers: Dict[str, str]) -> Any:
+    """GET a GitHub API URL and decode its JSON body, revalidating cached bodies by ETag."""
+    cached_response, headers = _conditional_headers(url, headers)
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304 and cached_response is not None:
+            return _json_loads(cached_response[1])
+        response.raise_for_status()
+        body = await response.read()
+        data = _json_loads(body)
+        _remember_etag(url, response.headers.get("ETag"), body)
+        return data
+
+def _get_json_sync(http: requests.Session, url: str, headers: Dict[str, str]) -> Any:
+    """Synchronous counterpart of _get_json."""
+    cached_response, headers = _conditional_headers(url, headers)
+    response = http.get(url, headers=headers)
+    if response.status_code == 304 and cached_response is not None:
+        return _json_loads(cached_response[1])
+    response.raise_for_status()
+    data = _json_loads(response.content)
+    _remember_etag(url, response.headers.get("ETag"), response.content)
+    return data
+
+async def _fetch_language_bytes(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    username: str,
+    repos_data: List[Dict[str, Any]],
+    headers: Dict[str, str]
+) -> Dict[str, int]:
+    """Sum each language's byte count across the user's repositories."""
+    semaphore = asyncio.Semaphore(GITHUB_LANGUAGE_CONCURRENCY)
+    
+    async def fetch_repo_languages(repo_name: str) -> Dict[str, int]:
+        async with semaphore:
+            return await _get_json(session, f"{base_url}/repos/{username}/{repo_name}/languages", headers)
+    
+    language_bytes = Counter()
+    for repo_languages in await asyncio.gather(*(fetch_repo_languages(repo["name"]) for repo in repos_data)):
+        language_bytes.update(repo_languages)
+    return dict(language_bytes)
+
+async def fetch_github_profile_async(
+    username: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    language_bytes: bool = False
+) -> Dict[str, Any]:
     """
     Fetch GitHub profile data using the GitHub API.
     
+    The profile, repository and event requests don't depend on each other,
+    so they are sent concurrently.
+    
     Args:
         username (str): GitHub username
+        session (Optional[aiohttp.ClientSession]): Session to reuse connections from
+        language_bytes (bool): Also fetch each repository's languages and add
+            their summed byte counts as "language_bytes". Costs one extra
+            request per repository, sent concurrently.
         
     Returns:
         Dict containing profile information
@@ -26,40 +135,43 @@ def fetch_github_profile(username: str) -> Dict[str, Any]:
     if token := os.getenv("GITHUB_TOKEN"):
         headers["Authorization"] = f"token {token}"
     
+    with _profile_cache_lock:
+        profile = _profile_cache.get((username, language_bytes))
+    if profile is not None:
+        return profile
+    
+    own_session = session is None
+    if own_session:
+        session = aiohttp.ClientSession()
+    
     try:
-        # Get user profile
-        user_url = f"{base_url}/users/{username}"
-        user_response = requests.get(user_url, headers=headers)
-        user_response.raise_for_status()
-        user_data = user_response.json()
+        # Get user profile, the first page of repositories and contributions.
+        # Only the first page of events is needed for the activity score.
+        repos_url = f"{base_url}/users/{username}/repos?per_page={GITHUB_PAGE_SIZE}"
+        user_data, repos_data, contributions_data = await asyncio.gather(
+            _get_json(session, f"{base_url}/users/{username}", headers),
+            _get_json(session, repos_url, headers),
+            _get_json(session, f"{base_url}/users/{username}/events/public", headers)
+        )
         
-        # Get user repositories
-        repos_url = f"{base_url}/users/{username}/repos"
-        repos_response = requests.get(repos_url, headers=headers)
-        repos_response.raise_for_status()
-        repos_data = repos_response.json()
-        
-        # Get user contributions
-        contributions_url = f"{base_url}/users/{username}/events/public"
-        contributions_response = requests.get(contributions_url, headers=headers)
-        contributions_response.raise_for_status()
-        contributions_data = contributions_response.json()
+        # The profile's repository count says how many more pages there are,
+        # so fetch the rest together
+        page_count = -(-(user_data.get("public_repos") or 0) // GITHUB_PAGE_SIZE)
+        if page_count > 1:
+            remaining_pages = await asyncio.gather(*(
+                _get_json(session, f"{repos_url}&page={page}", headers)
+                for page in range(2, page_count + 1)
+            ))
+            repos_data = [repo for page in (repos_data, *remaining_pages) for repo in page]
         
         # Process repository data
-        languages = {}
-        total_stars = 0
-        for repo in repos_data:
-            # Count stars
-            total_stars += repo.get("stargazers_count", 0)
-            
-            # Get language statistics
-            if repo.get("language"):
-                languages[repo["language"]] = languages.get(repo["language"], 0) + 1
+        total_stars = sum(repo.get("stargazers_count", 0) for repo in repos_data)
+        languages = dict(Counter(repo["language"] for repo in repos_data if repo.get("language")))
         
         # Calculate activity score based on contributions
         activity_score = len(contributions_data)
         
-        return {
+        profile = {
             "name": user_data.get("name"),
             "bio": user_data.get("bio"),
             "location": user_data.get("location"),
@@ -73,19 +185,73 @@ def fetch_github_profile(username: str) -> Dict[str, Any]:
             "activity_score": activity_score,
             "last_updated": datetime.now().isoformat()
         }
+        if language_bytes:
+            profile["language_bytes"] = await _fetch_language_bytes(session, base_url, username, repos_data, headers)
         
-    except requests.exceptions.RequestException as e:
+        with _profile_cache_lock:
+            _profile_cache[(username, language_bytes)] = profile
+        return profile
+        
+    except aiohttp.ClientError as e:
         raise GitHubAPIError(f"Error fetching GitHub data: {str(e)}")
     except Exception as e:
         raise GitHubAPIError(f"Unexpected error: {str(e)}")
+    finally:
+        if own_session:
+            await session.close()
 
-def get_repository_details(username: str, repo_name: str) -> Dict[str, Any]:
+def fetch_github_profile(username: str, language_bytes: bool = False) -> Dict[str, Any]:
+    """
+    Fetch GitHub profile data using the GitHub API.
+    
+    Synchronous wrapper around fetch_github_profile_async.
+    
+    Args:
+        username (str): GitHub username
+        language_bytes (bool): Also fetch per-repository language byte counts
+        
+    Returns:
+        Dict containing profile information
+    """
+    return asyncio.run(fetch_github_profile_async(username, language_bytes=language_bytes))
+
+async def fetch_github_user_async(username: str, session: aiohttp.ClientSession) -> Dict[str, Any]:
+    """
+    Fetch a user's raw record from the GitHub users API.
+    
+    Repeat lookups send the last ETag, so an unchanged user costs an empty
+    304 instead of a full response.
+    
+    Args:
+        username (str): GitHub username
+        session (aiohttp.ClientSession): Session to reuse connections from
+        
+    Returns:
+        Dict containing the GitHub API user record
+    """
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "Candidate-Verification-System"
+    }
+    
+    if token := os.getenv("GITHUB_TOKEN"):
+        headers["Authorization"] = f"token {token}"
+    
+    return await _get_json(session, f"https://api.github.com/users/{username}", headers)
+
+@cached(
+    TTLCache(maxsize=GITHUB_CACHE_SIZE, ttl=GITHUB_CACHE_TTL),
+    key=lambda username, repo_name, session=None: hashkey(username, repo_name),
+    lock=threading.Lock()
+)
+def get_repository_details(username: str, repo_name: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """
     Get detailed information about a specific repository.
     
     Args:
         username (str): GitHub username
         repo_name (str): Repository name
+        session (Optional[requests.Session]): Session to reuse connections from
         
     Returns:
         Dict containing repository details
@@ -99,11 +265,11 @@ def get_repository_details(username: str, repo_name: str) -> Dict[str, Any]:
     if token := os.getenv("GITHUB_TOKEN"):
         headers["Authorization"] = f"token {token}"
     
+    http = session or _session
+    
     try:
         repo_url = f"{base_url}/repos/{username}/{repo_name}"
-        response = requests.get(repo_url, headers=headers)
-        response.raise_for_status()
-        repo_data = response.json()
+        repo_data = _get_json_sync(http, repo_url, headers)
         
         return {
             "name": repo_data.get("name"),
@@ -0,0 +1,22 @@
+"""
+Gunicorn settings for running the API in production:
+
+    cd backend
+    gunicorn -c gunicorn_conf.py main:app
+
+Requests are spread over several Uvicorn worker processes so the CPU-bound
+resume and portfolio parsing use every core. By default the server listens on
+a Unix socket for a reverse proxy such as nginx on the same host; set BIND
+(e.g. "0.0.0.0:8000") to listen on TCP instead.
+"""
+import os
+
+bind = os.getenv("BIND", "unix:/tmp/app.sock")
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1)))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Keep idle connections from the proxy open longer than its own keep-alive
+keepalive = 65
+
+# Resume parsing and browser-backed scrapes can take a while
+timeout = 120
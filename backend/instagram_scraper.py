@@ -1,18 +1,25 @@
+import asyncio
+import atexit
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+import lxml.html
+import orjson
 import re
 import time
-from typing import Optional, Dict, Any
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from cachetools import TTLCache
+from typing import Optional, Dict, Any, Iterator, List
 import logging
 from datetime import datetime
 import random
 import selenium
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 # Import Service based on Selenium version
 
@@ -20,18 +27,175 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+PROFILE_CACHE_SIZE = 1024
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Resource types the browser fallback never needs, blocked to cut page weight
+BLOCKED_RESOURCE_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.mp4", "*.woff", "*.woff2", "*.ttf", "*.css"
+]
+
+# Patterns compiled once at import instead of on every profile parsed
+_COUNTS_RE = re.compile(r'(\d[\d,]*)\s*Followers,\s*(\d[\d,]*)\s*Following,\s*(\d[\d,]*)\s*Posts')
+_TITLE_USERNAME_RE = re.compile(r'@?([a-zA-Z0-9._-]+)')
+_COMMA_TRANSLATE = str.maketrans('', '', ',')  # Strips thousands separators from counts
+_HEAD_RE = re.compile(r'<head\b[^>]*>.*?</head>', re.S | re.I)
+# Any attribute order and quoting, e.g. a nonce before the type or single quotes
+_LD_JSON_RE = re.compile(r'<script\b[^>]*\btype=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>', re.S | re.I)
+# Profile URL, @handle or bare username, tried in one pass
+_USERNAME_RE = re.compile(r'instagram\.com/([^/?#\s]+)|^@([^/?#\s]+)$|^([a-zA-Z0-9._]+)$')
+
+def extract_username_from_url(url: str) -> str:
+    """
+    Extract an Instagram username from a profile URL or handle.
+    
+    Args:
+        url (str): Profile URL, @handle or bare username
+        
+    Returns:
+        str: The username, or the stripped input if no pattern matched
+    """
+    url = url.strip()
+    match = _USERNAME_RE.search(url)
+    if match:
+        return match.group(match.lastindex)
+    return url
+
+def _extract_from_html(page_source: str) -> Optional[Dict[str, Any]]:
+    """Extract profile data from a profile page's HTML."""
+    profile_info = {}
+    try:
+        # Try to find the profile data in script tags (application/ld+json),
+        # pulled out with a regex so no DOM is built when they have it
+        for script_text in _LD_JSON_RE.findall(page_source):
+            # Skip sibling blobs (breadcrumbs, organization, ...) without decoding them
+            if '"ProfilePage"' not in script_text:
+                continue
+            try:
+                data = orjson.loads(script_text)
+                if isinstance(data, dict) and data.get('@type') == 'ProfilePage':
+                    logger.info("Found data in application/ld+json script tag.")
+                    author_data = data.get('author', {})
+                    profile_info.update({
+                        'username': author_data.get('alternateName', '').replace('@', ''),
+                        'full_name': author_data.get('name', ''),
+                        'biography': author_data.get('description', ''),
+                        'profile_pic_url': author_data.get('image', ''),
+                        'external_url': author_data.get('url', ''),
+                        'timestamp': datetime.now().isoformat()
+                    })
+                    # If we found this structured data, it's likely the main info, return it.
+                    return profile_info
+            except (orjson.JSONDecodeError, AttributeError) as e:
+                logger.debug(f"Error parsing application/ld+json script: {e}")
+                continue # Try next script tag
+            except Exception as e:
+                logger.debug(f"Unexpected error in application/ld+json script parsing: {e}")
+                continue
+
+        logger.warning("Could not find primary data in application/ld+json script tags. Falling back to meta tags.")
+
+        # Fallback to meta tags if JSON extraction fails or wasn't primary.
+        # They all live in <head>, so parse just that when it can be found.
+        head = _HEAD_RE.search(page_source)
+        tree = lxml.html.fromstring(head.group(0) if head else page_source)
+        
+        # Collect the description, og:image and title in one pass over the
+        # tree, stopping as soon as all three have been seen
+        description = profile_pic = title = None
+        for element in tree.iter('meta', 'title'):
+            if element.tag == 'title':
+                if title is None:
+                    title = element.text or ''
+            elif description is None and element.get('name') == 'description':
+                description = element.get('content')
+            elif profile_pic is None and element.get('property') == 'og:image':
+                profile_pic = element.get('content')
+            if description is not None and profile_pic is not None and title is not None:
+                break
+        
+        # Get description
+        content = description or ''
+        if description is not None:
+            profile_info['description_meta'] = content # Store raw meta description
+            logger.info(f"Found meta description: {content[:100]}...")
+            
+            # Extract numbers from description
+            match = _COUNTS_RE.search(content)
+            if match:
+                logger.info("Extracted counts from meta description.")
+                try:
+                    followers, following, posts = (
+                        int(count.translate(_COMMA_TRANSLATE)) for count in match.groups()
+                    )
+                    profile_info.update({
+                        'followers_count': followers,
+                        'following_count': following,
+                        'posts_count': posts
+                    })
+                except ValueError:
+                    logger.warning("Could not convert follower/following/post counts to int from meta description.")
+
+        # Get profile picture from og:image
+        if profile_pic is not None:
+            profile_info['profile_pic_url'] = profile_pic
+            logger.info("Found og:image meta tag.")
+
+        # Get title and try to extract username
+        if title:
+            profile_info['title'] = title.strip()
+            logger.info(f"Found title: {title.strip()}")
+            # Extract username from title (basic attempt)
+            username_match = _TITLE_USERNAME_RE.search(title)
+            if username_match:
+                 # Only update username if not already found and seems valid
+                if 'username' not in profile_info or not profile_info['username']:
+                    profile_info['username'] = username_match.group(1)
+                    logger.info(f"Extracted username from title: {profile_info['username']}")
+
+        # Attempt to find biography in meta description or other common places
+        if 'biography' not in profile_info or not profile_info['biography']:
+            # Check if it looks like a typical bio (not just counts)
+            if content and 'Followers' not in content:
+                profile_info['biography'] = content
+                logger.info("Found biography in meta description.")
+
+        # Return gathered info, even if incomplete
+        return profile_info if profile_info else None
+
+    except Exception as e:
+        logger.error(f"Unexpected error during profile data extraction: {e}")
+        return None
+
 class InstagramScraper:
-    def __init__(self, rate_limit: int = 5):
+    def __init__(self, rate_limit: int = 5, keep_driver: bool = True, burst: int = 1, cache_ttl: int = 3600):
         """
         Initialize the Instagram scraper with rate limiting.
         
         Args:
-            rate_limit (int): Minimum seconds between requests
+            rate_limit (int): Average seconds between requests (0 disables limiting)
+            keep_driver (bool): Keep the WebDriver running between scrape_profile
+                calls instead of quitting it after each one. It is quit by close()
+                or at interpreter exit.
+            burst (int): Requests allowed back to back before the rate limit applies
+            cache_ttl (int): Seconds to reuse a successfully scraped profile (0 disables caching)
         """
         self.rate_limit = rate_limit
-        self.last_request_time = 0
-        self.driver = None
-        self._setup_driver()
+        self.keep_driver = keep_driver
+        # Token bucket: holds up to `burst` tokens, refilling one every rate_limit seconds
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        self._cache: Optional[TTLCache] = TTLCache(maxsize=PROFILE_CACHE_SIZE, ttl=cache_ttl) if cache_ttl > 0 else None
+        self._cache_lock = threading.Lock()
+        self.driver = None  # Started on the first profile that needs a browser
+        # Pooled session for the static fetches, so profiles reuse TLS connections
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+        self.http.headers.update({'User-Agent': USER_AGENT})
 
     def _setup_driver(self):
         """Set up the Selenium WebDriver with Chrome options."""
@@ -42,7 +206,10 @@ class InstagramScraper:
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')  # Only the HTML is read
+            # Return from driver.get() at DOMContentLoaded rather than after every subresource
+            chrome_options.page_load_strategy = 'eager'
             
             driver_path = None
             # Attempt to find chromedriver automatically using webdriver-manager
@@ -77,6 +244,16 @@ class InstagramScraper:
                  self.driver = webdriver.Chrome(options=chrome_options)
                  logger.warning("WebDriver initialized assuming chromedriver is in PATH (executable_path not provided).")
 
+            # Skip downloading media, fonts and stylesheets the scraper never reads
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+            except Exception as e:
+                logger.warning(f"Could not block page resources: {e}")
+
+            # Quit the browser at exit even if close() is never called
+            atexit.register(self.close)
+
             logger.info("WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
@@ -84,109 +261,35 @@ class InstagramScraper:
             raise
 
     def _respect_rate_limit(self):
-        """Ensure we don't make requests too frequently."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.rate_limit:
-            time.sleep(self.rate_limit - time_since_last_request)
-        self.last_request_time = time.time()
+        """Ensure we don't make requests too frequently, sleeping until a token is free."""
+        if self.rate_limit <= 0:
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) / self.rate_limit)
+            self._last_refill = now
+            if self._tokens < 1:
+                # Sleeping under the lock makes concurrent callers queue for tokens in turn
+                time.sleep((1 - self._tokens) * self.rate_limit)
+                self._tokens = 1
+                self._last_refill = time.monotonic()
+            self._tokens -= 1
 
     def _extract_profile_data(self) -> Optional[Dict[str, Any]]:
         """Extract profile data from the current page."""
-        profile_info = {}
         try:
-            # Wait for the main content to load
+            # The ld+json and meta tags are in the initial HTML, so wait only until
+            # it has been parsed rather than for the app to render <main>
             try:
                 WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "main"))
+                    lambda driver: driver.execute_script("return document.readyState") != "loading"
                 )
-                logger.info("Main content loaded.")
+                logger.info("Page content loaded.")
             except TimeoutException:
-                logger.warning("Timeout waiting for main content.")
+                logger.warning("Timeout waiting for page content.")
                 # Continue attempting to parse even if timeout occurs, as some content might be available
 
-            # Get the page source and parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # Try to find the profile data in script tags (application/ld+json)
-            scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict) and data.get('@type') == 'ProfilePage':
-                        logger.info("Found data in application/ld+json script tag.")
-                        author_data = data.get('author', {})
-                        profile_info.update({
-                            'username': author_data.get('alternateName', '').replace('@', ''),
-                            'full_name': author_data.get('name', ''),
-                            'biography': author_data.get('description', ''),
-                            'profile_pic_url': author_data.get('image', ''),
-                            'external_url': author_data.get('url', ''),
-                            'timestamp': datetime.now().isoformat()
-                        })
-                        # If we found this structured data, it's likely the main info, return it.
-                        return profile_info
-                except (json.JSONDecodeError, AttributeError) as e:
-                    logger.debug(f"Error parsing application/ld+json script: {e}")
-                    continue # Try next script tag
-                except Exception as e:
-                    logger.debug(f"Unexpected error in application/ld+json script parsing: {e}")
-                    continue
-
-            logger.warning("Could not find primary data in application/ld+json script tags. Falling back to meta tags.")
-
-            # Fallback to meta tags if JSON extraction fails or wasn't primary
-            
-            # Get description
-            meta_description = soup.find('meta', {'name': 'description'})
-            if meta_description:
-                content = meta_description.get('content', '')
-                profile_info['description_meta'] = content # Store raw meta description
-                logger.info(f"Found meta description: {content[:100]}...")
-                
-                # Extract numbers from description
-                match = re.search(r'(\d[\d,]*)\s*Followers,\s*(\d[\d,]*)\s*Following,\s*(\d[\d,]*)\s*Posts', content)
-                if match:
-                    logger.info("Extracted counts from meta description.")
-                    try:
-                        profile_info.update({
-                            'followers_count': int(match.group(1).replace(',', '')),
-                            'following_count': int(match.group(2).replace(',', '')),
-                            'posts_count': int(match.group(3).replace(',', ''))
-                        })
-                    except ValueError:
-                        logger.warning("Could not convert follower/following/post counts to int from meta description.")
-
-            # Get profile picture from og:image
-            profile_pic = soup.find('meta', {'property': 'og:image'})
-            if profile_pic:
-                profile_info['profile_pic_url'] = profile_pic.get('content')
-                logger.info("Found og:image meta tag.")
-
-            # Get title and try to extract username
-            title = soup.find('title')
-            if title:
-                profile_info['title'] = title.text.strip()
-                logger.info(f"Found title: {title.text.strip()}")
-                # Extract username from title (basic attempt)
-                username_match = re.search(r'@?([a-zA-Z0-9._-]+)', title.text)
-                if username_match:
-                     # Only update username if not already found and seems valid
-                    if 'username' not in profile_info or not profile_info['username']:
-                        profile_info['username'] = username_match.group(1)
-                        logger.info(f"Extracted username from title: {profile_info['username']}")
-
-            # Attempt to find biography in meta description or other common places
-            if 'biography' not in profile_info or not profile_info['biography']:
-                meta_description_tag = soup.find('meta', attrs={'name': 'description'})
-                if meta_description_tag and meta_description_tag.get('content'):
-                     # Check if it looks like a typical bio (not just counts)
-                     if 'Followers' not in meta_description_tag['content']:
-                         profile_info['biography'] = meta_description_tag.get('content')
-                         logger.info("Found biography in meta description.")
-
-            # Return gathered info, even if incomplete
-            return profile_info if profile_info else None
+            return _extract_from_html(self.driver.page_source)
 
         except TimeoutException:
             logger.error("Timeout while waiting for page elements")
@@ -195,6 +298,36 @@ class InstagramScraper:
             logger.error(f"Unexpected error during profile data extraction: {e}")
             return None
 
+    def _fetch_static(self, url: str) -> Optional[str]:
+        """
+        Fetch a profile page's HTML without a browser.
+        
+        Args:
+            url (str): Profile URL
+            
+        Returns:
+            Optional[str]: The HTML if it carries profile data, None otherwise
+        """
+        try:
+            response = self.http.get(url, timeout=10)
+        except requests.RequestException as e:
+            logger.warning(f"Static fetch of {url} failed: {e}")
+            return None
+        # Redirects to the login page and pages without profile markup need a browser
+        if response.status_code != 200 or "accounts/login" in response.url:
+            return None
+        html = response.text
+        if 'application/ld+json' in html or 'og:image' in html:
+            return html
+        return None
+
+    def _remember_profile(self, username: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successfully scraped profile and return it."""
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache[username] = profile_data
+        return profile_data
+
     def scrape_profile(self, username: str) -> Dict[str, Any]:
         """
         Scrape public profile data from an Instagram username.
@@ -207,13 +340,32 @@ class InstagramScraper:
         """
         profile_url = f"https://www.instagram.com/{username}/"
         
+        if self._cache is not None:
+            with self._cache_lock:
+                cached_profile = self._cache.get(username)
+            if cached_profile is not None:
+                logger.info(f"Using cached data for @{username}")
+                return cached_profile
+        
         try:
+            self._respect_rate_limit()
+            logger.info(f"Attempting to scrape: {profile_url}")
+            
+            # The profile's ld+json and meta tags are usually in the static HTML,
+            # so try a plain HTTP fetch before paying for a browser render
+            html = self._fetch_static(profile_url)
+            profile_data = _extract_from_html(html) if html else None
+            if profile_data:
+                profile_data['username'] = username
+                logger.info(f"Successfully scraped data for @{username} from static HTML")
+                return self._remember_profile(username, profile_data)
+            
             # Ensure driver is initialized before use
             if not self.driver:
-                self._setup_driver()  # Re-initialize if it was closed
+                self._setup_driver()  # Created on first browser fallback, or re-initialized if closed
 
             self._respect_rate_limit()
-            logger.info(f"Attempting to scrape: {profile_url}")
+            logger.info(f"Falling back to browser for: {profile_url}")
             
             # Navigate to the profile page with retry logic
             max_retries = 3
@@ -221,8 +373,11 @@ class InstagramScraper:
             while retry_count < max_retries:
                 try:
                     self.driver.get(profile_url)
+                    # page_source serializes the whole DOM over the WebDriver
+                    # protocol, so read it once for the login and not-found checks
+                    page_source = self.driver.page_source
                     # Check if we got a login page
-                    if "Login" in self.driver.title or "login" in self.driver.page_source.lower():
+                    if "Login" in self.driver.title or "login" in page_source.lower():
                         logger.warning(f"Got login page for @{username}, profile might be private")
                         return {
                             'username': username,
@@ -243,7 +398,7 @@ class InstagramScraper:
                     time.sleep(2)  # Wait before retrying
             
             # Check if profile exists or is private
-            if "Page Not Found" in self.driver.page_source or "Sorry, this page isn't available" in self.driver.page_source:
+            if "Page Not Found" in page_source or "Sorry, this page isn't available" in page_source:
                 logger.error(f"Profile @{username} not found or unavailable.")
                 return {
                     'username': username,
@@ -258,7 +413,7 @@ class InstagramScraper:
                 # Ensure username is consistent, prioritize the requested one
                 profile_data['username'] = username
                 logger.info(f"Successfully scraped data for @{username}")
-                return profile_data
+                return self._remember_profile(username, profile_data)
             
             # If all extraction methods fail
             logger.error(f"Could not extract profile data for @{username}")
@@ -276,34 +431,235 @@ class InstagramScraper:
                 'timestamp': datetime.now().isoformat()
             }
         finally:
-            # Clean up the driver
-            try:
-                if self.driver:
-                    self.driver.quit()
-                    self.driver = None
-            except Exception as e:
-                logger.error(f"Error closing driver: {str(e)}")
+            # Clean up the driver unless it is being reused
+            if not self.keep_driver:
+                self._quit_driver()
 
-    def __del__(self):
-        """Clean up the WebDriver when the object is destroyed."""
-        if self.driver:
-            self.driver.quit()
+    def _quit_driver(self):
+        """Quit the WebDriver if it is running."""
+        try:
+            if self.driver:
+                self.driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing driver: {str(e)}")
+        finally:
+            self.driver = None
+            atexit.unregister(self.close)
+
+    def close(self):
+        """Quit the WebDriver if it is running and release the HTTP session's connections."""
+        self._quit_driver()
+        self.http.close()
+
+    def __enter__(self) -> "InstagramScraper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class InstagramScraperPool:
+    def __init__(self, rate_limit: int = 5, cache_ttl: int = 3600, max_size: int = 4):
+        """
+        Thread-safe pool of scrapers that keep their WebDriver between profiles,
+        so several profiles can be scraped concurrently.
+        
+        Args:
+            rate_limit (int): Minimum seconds between profile scrapes across the
+                whole pool (0 disables limiting). Pooled scrapers don't throttle
+                themselves, so concurrent leases can't multiply the request rate.
+            cache_ttl (int): Seconds to reuse a successfully scraped profile. The
+                cache is shared by the pool rather than kept per scraper, so a
+                hit doesn't depend on which scraper is leased.
+            max_size (int): Most scrapers, and so browsers, the pool starts.
+                Leases wait for an idle scraper once this many exist.
+        """
+        self.rate_limit = rate_limit
+        self.max_size = max_size
+        self._next_request = 0.0
+        self._rate_lock = threading.Lock()
+        self._cache: TTLCache = TTLCache(maxsize=PROFILE_CACHE_SIZE, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+        self._idle: "queue.SimpleQueue[InstagramScraper]" = queue.SimpleQueue()
+        self._created: List[InstagramScraper] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self) -> Iterator[InstagramScraper]:
+        """Borrow an idle scraper, creating one if none is free and the pool isn't full."""
+        try:
+            scraper = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                scraper = None
+                if len(self._created) < self.max_size:
+                    scraper = InstagramScraper(rate_limit=0, cache_ttl=0)
+                    self._created.append(scraper)
+            if scraper is None:
+                scraper = self._idle.get()
+        try:
+            yield scraper
+        finally:
+            self._idle.put(scraper)
+
+    def reserve_request(self) -> float:
+        """Reserve the pool's next request slot and return how long to wait for it."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self.rate_limit
+        return start - now
+
+    def cached_profile(self, username: str) -> Optional[Dict[str, Any]]:
+        """Return a recently scraped profile, or None if it isn't cached."""
+        with self._cache_lock:
+            return self._cache.get(username)
+
+    def scrape_profile(self, username: str, throttle: bool = True) -> Dict[str, Any]:
+        """
+        Scrape a profile with a pooled scraper. See InstagramScraper.scrape_profile.
+        
+        Args:
+            username (str): Instagram username to scrape
+            throttle (bool): Wait for the pool's rate limit first. Async callers
+                pass False after awaiting reserve_request() themselves, so the
+                wait doesn't hold a worker thread.
+        """
+        profile_data = self.cached_profile(username)
+        if profile_data is not None:
+            logger.info(f"Using cached data for @{username}")
+            return profile_data
+        
+        if throttle:
+            time.sleep(self.reserve_request())
+        with self.lease() as scraper:
+            profile_data = scraper.scrape_profile(username)
+        
+        # Errors are often transient (rate limits, timeouts), so only cache successes
+        if 'error' not in profile_data:
+            with self._cache_lock:
+                self._cache[username] = profile_data
+        return profile_data
+
+    def close(self):
+        """Quit every pooled scraper's WebDriver and close its HTTP session."""
+        with self._lock:
+            for scraper in self._created:
+                scraper.close()
+
+    def __enter__(self) -> "InstagramScraperPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class AsyncInstagramScraper:
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        rate_limit: float = 1.0,
+        browser_fallback: Optional[InstagramScraperPool] = None
+    ):
+        """
+        Scrape many profiles concurrently from their static HTML, without a browser.
+        
+        Args:
+            max_concurrency (int): Maximum profiles fetched at once
+            rate_limit (float): Minimum seconds between request starts
+            browser_fallback (Optional[InstagramScraperPool]): Pool to scrape with
+                Selenium when the static HTML has no profile data. Without one,
+                such profiles are returned as errors.
+        """
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.browser_fallback = browser_fallback
+        self._next_request = 0.0
+
+    async def _wait_for_slot(self):
+        """Space request starts at least rate_limit seconds apart."""
+        now = time.monotonic()
+        start = max(now, self._next_request)
+        self._next_request = start + self.rate_limit
+        await asyncio.sleep(start - now)
+
+    async def _scrape_one(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        username: str
+    ) -> Dict[str, Any]:
+        """Scrape one profile on a shared session."""
+        profile_url = f"https://www.instagram.com/{username}/"
+        error = 'Could not extract profile data'
+        try:
+            async with semaphore:
+                await self._wait_for_slot()
+                logger.info(f"Attempting to scrape: {profile_url}")
+                async with session.get(profile_url) as response:
+                    # A stray undecodable byte shouldn't lose the whole profile
+                    html = await response.text(errors="replace")
+                    status, final_url = response.status, str(response.url)
+            
+            if status == 404:
+                error = 'Profile not found or unavailable'
+            elif "accounts/login" in final_url:
+                error = 'Profile is private or requires login'
+            elif status == 200:
+                profile_data = _extract_from_html(html)
+                if profile_data:
+                    profile_data['username'] = username
+                    logger.info(f"Successfully scraped data for @{username} from static HTML")
+                    return profile_data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Static fetch of {profile_url} failed: {e!r}")
+            error = 'Failed to connect to Instagram'
+        
+        if self.browser_fallback:
+            return await asyncio.to_thread(self.browser_fallback.scrape_profile, username)
+        
+        logger.error(f"Could not scrape @{username}: {error}")
+        return {
+            'username': username,
+            'error': error,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    async def scrape_profiles(self, usernames: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape several profiles concurrently.
+        
+        Args:
+            usernames (List[str]): Instagram usernames to scrape
+            
+        Returns:
+            List of profile dicts or error details, in the same order as usernames
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession(headers={'User-Agent': USER_AGENT}) as session:
+            return await asyncio.gather(*(
+                self._scrape_one(session, semaphore, username) for username in usernames
+            ))
+
+    async def scrape_profile(self, username: str) -> Dict[str, Any]:
+        """Scrape a single profile. See scrape_profiles."""
+        return (await self.scrape_profiles([username]))[0]
 
 # Example usage
 if __name__ == "__main__":
     # Ensure you have chromedriver installed and in your PATH
     # Or specify the executable_path when initializing webdriver.Chrome
-    scraper = InstagramScraper(rate_limit=5)
     test_usernames = ["instagram", "therock", "nasa", "nitish5300", "this_user_does_not_exist_12345"]
     
-    for username in test_usernames:
-        print(f"\nScraping data for @{username}...")
-        profile_data = scraper.scrape_profile(username)
-        
-        if 'error' not in profile_data:
-            print("\n--- Scraped Instagram Data ---")
-            for key, value in profile_data.items():
-                if key != 'timestamp':
-                    print(f"{key.replace('_', ' ').title()}: {value}")
-        else:
-            print(f"Error: {profile_data['error']}")
\ No newline at end of file
+    with InstagramScraperPool(rate_limit=5) as pool:
+        # Scrape a few profiles at a time, each worker leasing its own scraper
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = executor.map(pool.scrape_profile, test_usernames)
+            for username, profile_data in zip(test_usernames, results):
+                print(f"\nScraped data for @{username}...")
+                
+                if 'error' not in profile_data:
+                    print("\n--- Scraped Instagram Data ---")
+                    for key, value in profile_data.items():
+                        if key != 'timestamp':
+                            print(f"{key.replace('_', ' ').title()}: {value}")
+                else:
+                    print(f"Error: {profile_data['error']}")
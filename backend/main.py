@@ -1,20 +1,26 @@
 from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import APIKeyHeader
 from typing import Optional, Dict, Any
 import uvicorn
+import aiohttp
+import asyncio
 import os
+import sys
 from dotenv import load_dotenv
 import logging
 from datetime import datetime
-import requests
 from pydantic import BaseModel
-from instagram_scraper import InstagramScraper
+from instagram_scraper import InstagramScraperPool
 from resume_parser import parse_resume, ResumeParserError
-from tempfile import SpooledTemporaryFile
-from web_scraper import scrape_portfolio, save_to_json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from web_scraper import scrape_portfolio, close_playwright, WebScraperError
 
-from github_extractor import fetch_github_profile
+from github_extractor import fetch_github_user_async
+from cachetools import TTLCache
 
 # Load environment variables
 load_dotenv()
@@ -33,7 +39,9 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Candidate Data Analyzer",
     description="API for analyzing candidate data from GitHub and Resumes",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the large resume and profile payloads much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -45,6 +53,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as a resume's raw_text; level 1 keeps the
+# CPU cost negligible while still shrinking text several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # API key security
 API_KEY_NAME = "X-API-Key"
 api_key_header = APIKeyHeader(name=API_KEY_NAME)
@@ -57,12 +69,73 @@ async def get_api_key(api_key: str = Depends(api_key_header)):
         )
     return api_key
 
-# Initialize Instagram scraper
-instagram_scraper = InstagramScraper(rate_limit=5)
+# Exception messages can embed whole pages or resume text, so error responses
+# and log lines only carry their start
+MAX_ERROR_DETAIL_LENGTH = 500
+
+def error_detail(e: Exception) -> str:
+    """Return an exception's message clamped to MAX_ERROR_DETAIL_LENGTH."""
+    return str(e)[:MAX_ERROR_DETAIL_LENGTH]
+
+# Minimum seconds between Instagram requests from this process, and the most
+# browsers it runs for them
+INSTAGRAM_RATE_LIMIT = 5
+INSTAGRAM_POOL_SIZE = 2
+
+@lru_cache(maxsize=None)
+def get_instagram_pool() -> InstagramScraperPool:
+    """
+    Create the Instagram scraper pool on first use, once per process. Each
+    request leases its own scraper, since a WebDriver can't be shared between
+    the worker threads handling concurrent requests. The pool throttles
+    requests across all of its scrapers and caps how many browsers it starts.
+    """
+    return InstagramScraperPool(rate_limit=INSTAGRAM_RATE_LIMIT, max_size=INSTAGRAM_POOL_SIZE)
 
 class InstagramProfileRequest(BaseModel):
     username: str
 
+# Shared GitHub client session, so concurrent requests reuse pooled keep-alive
+# connections to api.github.com. It is opened on startup to bind to the
+# server's event loop.
+github_session: Optional[aiohttp.ClientSession] = None
+
+# Recently served GitHub users, so repeat lookups skip the upstream round trip
+# and the unauthenticated rate limit. Once an entry expires, the request is
+# revalidated by ETag.
+github_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+@app.on_event("startup")
+async def open_github_session():
+    global github_session
+    github_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=20),
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers={"Accept": "application/vnd.github+json"}
+    )
+
+@app.on_event("startup")
+async def configure_default_executor():
+    # Blocking scraping and resume parsing run in this pool via asyncio.to_thread
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    )
+
+@app.on_event("shutdown")
+async def close_github_session():
+    if github_session:
+        await github_session.close()
+
+@app.on_event("shutdown")
+async def close_portfolio_browser():
+    await asyncio.to_thread(close_playwright)
+
+@app.on_event("shutdown")
+async def close_instagram_pool():
+    # Only tear the pool down if a request ever created it
+    if get_instagram_pool.cache_info().currsize:
+        await asyncio.to_thread(get_instagram_pool().close)
+
 @app.get("/")
 async def root():
     return {"message": "Candidate Data Analyzer API"}
@@ -71,10 +144,12 @@ async def root():
 async def get_github_profile(username: str, api_key: str = Depends(get_api_key)):
     try:
         logger.info(f"Fetching GitHub profile for user: {username}")
-        response = requests.get(f"https://api.github.com/users/{username}")
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        profile = github_user_cache.get(username)
+        if profile is None:
+            profile = await fetch_github_user_async(username, github_session)
+            github_user_cache[username] = profile
+        return profile
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"Error fetching GitHub profile: {str(e)}")
         raise HTTPException(status_code=404, detail=f"GitHub profile not found: {str(e)}")
 
@@ -84,7 +159,12 @@ async def get_instagram_profile(username: str):
     Fetch Instagram profile data for a given username.
     """
     try:
-        profile_data = instagram_scraper.scrape_profile(username)
+        pool = get_instagram_pool()
+        profile_data = pool.cached_profile(username)
+        if profile_data is None:
+            # Wait for the rate limit on the event loop rather than in a worker thread
+            await asyncio.sleep(pool.reserve_request())
+            profile_data = await asyncio.to_thread(pool.scrape_profile, username, False)
         
         if 'error' in profile_data:
             status_code = 404 if 'Profile not found' in profile_data['error'] else 500
@@ -94,11 +174,13 @@ async def get_instagram_profile(username: str):
             )
             
         return profile_data
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error scraping Instagram profile: {str(e)}")
+        logger.exception("Error scraping Instagram profile")
         raise HTTPException(
             status_code=500,
-            detail=f"Error scraping Instagram profile: {str(e)}"
+            detail=f"Error scraping Instagram profile: {error_detail(e)}"
         )
 
 @app.post("/resume/upload")
@@ -109,11 +191,10 @@ async def upload_resume(
     try:
         logger.info(f"Processing resume upload: {file.filename}")
         
-        # Read the file content into memory
-        content = await file.read()
-        
-        # Parse the resume using our parser
-        parsed_data = parse_resume(content, file.filename)
+        # Parse straight from the upload's spooled temporary file rather than
+        # reading the whole document into memory. Runs in a worker thread
+        # because PDF text extraction is CPU-heavy.
+        parsed_data = await asyncio.to_thread(parse_resume, file.file, file.filename)
         
         # Close the file to ensure it's not kept open
         await file.close()
@@ -124,31 +205,49 @@ async def upload_resume(
             "parsed_data": parsed_data
         }
     except ResumeParserError as e:
-        logger.error(f"Error parsing resume: {str(e)}")
+        detail = error_detail(e)
+        logger.error(f"Error parsing resume: {detail}")
         raise HTTPException(
             status_code=400,
-            detail=str(e)
+            detail=detail
         )
     except Exception as e:
-        logger.error(f"Error processing resume: {str(e)}")
+        logger.exception("Error processing resume")
         raise HTTPException(
             status_code=500,
-            detail=f"Error processing resume: {str(e)}"
+            detail=f"Error processing resume: {error_detail(e)}"
         )
     finally:
         # Ensure file is closed even if an error occurs
         await file.close()
 
-# Scrape a portfolio
-data = scrape_portfolio("https://example-portfolio.com")
-
-# Save to JSON
-save_to_json(data, "portfolio_data.json")
+@app.get("/portfolio")
+async def get_portfolio(url: str, api_key: str = Depends(get_api_key)):
+    """
+    Scrape a portfolio website. Runs in a worker thread so the blocking
+    fetch doesn't stall the event loop.
+    """
+    try:
+        logger.info(f"Scraping portfolio: {url}")
+        return await asyncio.to_thread(scrape_portfolio, url)
+    except WebScraperError as e:
+        detail = error_detail(e)
+        logger.error(f"Error scraping portfolio: {detail}")
+        raise HTTPException(
+            status_code=502,
+            detail=detail
+        )
 
 if __name__ == "__main__":
+    debug = os.getenv("DEBUG", "False").lower() == "true"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        # libuv-based event loop and C HTTP parser; uvloop doesn't support Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Auto-reload while developing, otherwise spread requests across worker processes
+        reload=debug,
+        workers=None if debug else int(os.getenv("WEB_CONCURRENCY", "4"))
     ) 
\ No newline at end of file
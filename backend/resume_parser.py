@@ -1,94 +1,160 @@
 import pdfplumber
 import docx
 import io
-from typing import Dict, Any, List
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, List, Optional, Union, BinaryIO
 import re
 from datetime import datetime
+from skill_search import build_skill_automaton, iter_skill_matches
 
 class ResumeParserError(Exception):
     pass
 
-def extract_text_from_pdf(content: bytes) -> str:
+# Common technical skills to look for
+COMMON_SKILLS = [
+    "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "PHP",
+    "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django",
+    "Flask", "Spring", "Express", "MongoDB", "MySQL", "PostgreSQL",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Linux",
+    "Agile", "Scrum", "DevOps", "CI/CD", "REST", "GraphQL", "API"
+]
+
+# Patterns are compiled once at import. The skills are folded into a single
+# alternation so the text is scanned once rather than once per skill.
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\+?[\d\s-]{10,}')
+_SKILLS_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(skill) for skill in sorted(COMMON_SKILLS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_SKILL_CASEMAP = {skill.lower(): skill for skill in COMMON_SKILLS}
+
+# With pyahocorasick installed, one automaton pass over the lowercased text finds
+# every skill; without it this is None and _SKILLS_RE is used
+_SKILL_AUTOMATON = build_skill_automaton(_SKILL_CASEMAP)
+
+# Look for common education patterns
+_EDUCATION_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(Bachelor|Master|PhD|B\.?Tech|M\.?Tech|B\.?E|M\.?E|B\.?Sc|M\.?Sc)[^.]*',
+    r'University of [^.]*',
+    r'[A-Z][a-z]+ University',
+    r'[A-Z][a-z]+ Institute'
+)]
+
+# Look for common experience patterns
+_EXPERIENCE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(Senior|Junior|Lead)?\s*(Software|Web|Mobile|Full Stack|Frontend|Backend|DevOps|Data|ML|AI)\s*(Engineer|Developer|Architect|Scientist)',
+    r'(Software|Web|Mobile|Full Stack|Frontend|Backend|DevOps|Data|ML|AI)\s*(Engineer|Developer|Architect|Scientist)',
+    r'(Project|Team|Technical)\s*(Manager|Lead|Architect)'
+)]
+
+# Below this many pages a PDF is extracted inline; each worker process has to
+# reopen the document, which outweighs the parallelism on short resumes
+PDF_PARALLEL_MIN_PAGES = 8
+
+# Process pool shared by every parallel PDF extraction, created on first use.
+# Only batch callers opt in to it; see extract_text_from_pdf.
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+_pdf_executor_lock = threading.Lock()
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    """Return the shared PDF extraction pool, starting it with one process per CPU if needed."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            _pdf_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _pdf_executor
+
+# Resume content, either in memory or as an open binary file. Passing the file
+# lets large uploads be parsed from disk without reading them into memory.
+ResumeSource = Union[bytes, BinaryIO]
+
+def _as_stream(content: ResumeSource) -> BinaryIO:
+    """Wrap in-memory content in a file object; pass open files through."""
+    return io.BytesIO(content) if isinstance(content, (bytes, bytearray)) else content
+
+def _extract_pdf_pages(content: bytes, start: int, stop: int) -> str:
+    """Extract the text of pages [start, stop) of a PDF. Runs in a worker process."""
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        return "".join(page.extract_text() or "" for page in pdf.pages[start:stop])
+
+def extract_text_from_pdf(content: ResumeSource, max_workers: Optional[int] = None) -> str:
     """
     Extract text from PDF content.
     
+    Text is extracted inline by default, which suits the API server where
+    each worker already handles many requests. Batch callers can pass
+    max_workers to split long documents into contiguous page ranges that
+    are extracted in parallel on a shared process pool.
+    
     Args:
-        content (bytes): PDF file content
+        content (ResumeSource): PDF file content or open binary file
+        max_workers (Optional[int]): Number of page ranges to extract in
+            parallel, or None to extract inline
         
     Returns:
         str: Extracted text
     """
     try:
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            text = ""
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-            return text
+        stream = _as_stream(content)
+        with pdfplumber.open(stream) as pdf:
+            page_count = len(pdf.pages)
+            workers = min(max_workers or 1, page_count)
+            if page_count < PDF_PARALLEL_MIN_PAGES or workers < 2:
+                return "".join(page.extract_text() or "" for page in pdf.pages)
+        
+        # Workers need picklable input, so send the document's bytes
+        if not isinstance(content, (bytes, bytearray)):
+            stream.seek(0)
+            content = stream.read()
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        executor = _get_pdf_executor()
+        return "".join(executor.map(_extract_pdf_pages, repeat(content), bounds[:-1], bounds[1:]))
     except Exception as e:
         raise ResumeParserError(f"Error extracting text from PDF: {str(e)}")
 
-def extract_text_from_docx(content: bytes) -> str:
+def extract_text_from_docx(content: ResumeSource) -> str:
     """
     Extract text from DOCX content.
     
     Args:
-        content (bytes): DOCX file content
+        content (ResumeSource): DOCX file content or open binary file
         
     Returns:
         str: Extracted text
     """
     try:
-        doc = docx.Document(io.BytesIO(content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        doc = docx.Document(_as_stream(content))
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
     except Exception as e:
         raise ResumeParserError(f"Error extracting text from DOCX: {str(e)}")
 
 def extract_email(text: str) -> str:
     """Extract email address from text."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else ""
 
 def extract_phone(text: str) -> str:
     """Extract phone number from text."""
-    phone_pattern = r'\+?[\d\s-]{10,}'
-    match = re.search(phone_pattern, text)
+    match = _PHONE_RE.search(text)
     return match.group(0) if match else ""
 
 def extract_skills(text: str) -> List[str]:
     """Extract skills from text."""
-    # Common technical skills to look for
-    common_skills = [
-        "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "PHP",
-        "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django",
-        "Flask", "Spring", "Express", "MongoDB", "MySQL", "PostgreSQL",
-        "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Linux",
-        "Agile", "Scrum", "DevOps", "CI/CD", "REST", "GraphQL", "API"
-    ]
-    
-    found_skills = []
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-            found_skills.append(skill)
-    
-    return found_skills
+    if _SKILL_AUTOMATON is not None:
+        found = {_SKILL_CASEMAP[name] for name in iter_skill_matches(_SKILL_AUTOMATON, text.lower())}
+    else:
+        found = {_SKILL_CASEMAP[match.lower()] for match in _SKILLS_RE.findall(text)}
+    return [skill for skill in COMMON_SKILLS if skill in found]
 
 def extract_education(text: str) -> List[Dict[str, str]]:
     """Extract education information from text."""
     education = []
-    # Look for common education patterns
-    edu_patterns = [
-        r'(Bachelor|Master|PhD|B\.?Tech|M\.?Tech|B\.?E|M\.?E|B\.?Sc|M\.?Sc)[^.]*',
-        r'University of [^.]*',
-        r'[A-Z][a-z]+ University',
-        r'[A-Z][a-z]+ Institute'
-    ]
-    
-    for pattern in edu_patterns:
-        matches = re.finditer(pattern, text)
+    for pattern in _EDUCATION_PATTERNS:
+        matches = pattern.finditer(text)
         for match in matches:
             education.append({
                 "degree": match.group(0),
@@ -101,15 +167,8 @@ def extract_education(text: str) -> List[Dict[str, str]]:
 def extract_experience(text: str) -> List[Dict[str, str]]:
     """Extract work experience from text."""
     experience = []
-    # Look for common experience patterns
-    exp_patterns = [
-        r'(Senior|Junior|Lead)?\s*(Software|Web|Mobile|Full Stack|Frontend|Backend|DevOps|Data|ML|AI)\s*(Engineer|Developer|Architect|Scientist)',
-        r'(Software|Web|Mobile|Full Stack|Frontend|Backend|DevOps|Data|ML|AI)\s*(Engineer|Developer|Architect|Scientist)',
-        r'(Project|Team|Technical)\s*(Manager|Lead|Architect)'
-    ]
-    
-    for pattern in exp_patterns:
-        matches = re.finditer(pattern, text)
+    for pattern in _EXPERIENCE_PATTERNS:
+        matches = pattern.finditer(text)
         for match in matches:
             experience.append({
                 "title": match.group(0),
@@ -120,13 +179,15 @@ def extract_experience(text: str) -> List[Dict[str, str]]:
     
     return experience
 
-def parse_resume(content: bytes, filename: str) -> Dict[str, Any]:
+def parse_resume(content: ResumeSource, filename: str, pdf_workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Parse resume content and extract relevant information.
     
     Args:
-        content (bytes): Resume file content
+        content (ResumeSource): Resume file content or open binary file
         filename (str): Name of the resume file
+        pdf_workers (Optional[int]): Parallel page ranges for long PDFs; see
+            extract_text_from_pdf
         
     Returns:
         Dict containing parsed resume information
@@ -134,7 +195,7 @@ def parse_resume(content: bytes, filename: str) -> Dict[str, Any]:
     try:
         # Determine file type and extract text
         if filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(content)
+            text = extract_text_from_pdf(content, pdf_workers)
         elif filename.lower().endswith('.docx'):
             text = extract_text_from_docx(content)
         else:
@@ -1,7 +1,7 @@
-from ai_analysis import analyze_candidate, JobRequirements
+from ai_analysis import analyze_candidate, JobRequirements, write_json
 from web_scraper import scrape_portfolio
-import json
 from typing import Dict, Any, List
+import logging
 
 def get_user_input() -> tuple:
     """Get user input for candidate analysis with default values for skills and requirements."""
@@ -67,8 +67,7 @@ def get_user_input() -> tuple:
 
 def save_analysis_results(results: Dict[str, Any], filename: str = "candidate_analysis.json") -> None:
     """Save analysis results to a JSON file."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    write_json(results, filename)
     print(f"✅ Analysis results saved to {filename}")
 
 def display_skill_matching(results: Dict[str, Any]) -> None:
@@ -128,6 +127,8 @@ def display_skill_matching(results: Dict[str, Any]) -> None:
             print(f"- {rec}")
 
 def main():
+    logging.basicConfig(level=logging.INFO)
+    
     try:
         print("🔍 Starting AI Skill Matching Engine...")
         
@@ -0,0 +1,45 @@
+from typing import Iterable, Iterator, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Callers fall back to their regex patterns
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Whether text[index] exists and is a regex word character."""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+def is_word_boundary(text: str, index: int) -> bool:
+    """Whether a regex word boundary falls at index in text."""
+    return _is_word_char(text, index - 1) != _is_word_char(text, index)
+
+def build_skill_automaton(names: Iterable[str]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton that finds every name in one pass over a text.
+
+    Args:
+        names (Iterable[str]): Lowercase skill names to search for
+
+    Returns:
+        The automaton, or None if pyahocorasick isn't installed
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name in names:
+        automaton.add_word(name, name)
+    automaton.make_automaton()
+    return automaton
+
+def iter_skill_matches(automaton: "ahocorasick.Automaton", text: str) -> Iterator[str]:
+    """
+    Yield the names found in text that stand as whole words, like a \\b-delimited regex.
+
+    Args:
+        automaton (ahocorasick.Automaton): Automaton from build_skill_automaton
+        text (str): Lowercased text to search
+    """
+    # The automaton reports every occurrence, so apply the word-boundary checks here
+    for end, name in automaton.iter(text):
+        if is_word_boundary(text, end - len(name) + 1) and is_word_boundary(text, end + 1):
+            yield name
@@ -0,0 +1,28 @@
+import pytest
+
+from instagram_scraper import _extract_from_html
+
+LD_JSON = (
+    '{"@context": "https://schema.org", "@type": "ProfilePage", "author": '
+    '{"alternateName": "@jane", "name": "Jane Doe", "description": "Builds things", '
+    '"url": "https://jane.dev", "image": "https://cdn.example/jane.jpg"}}'
+)
+
+@pytest.mark.parametrize("script_tag", [
+    '<script type="application/ld+json">',
+    '<script nonce="abc123" type="application/ld+json">',
+    "<script type='application/ld+json'>",
+    '<script type=application/ld+json nonce="abc123">',
+])
+def test_extract_from_html_ld_json_script_variants(script_tag):
+    html = f'<html><head>{script_tag}{LD_JSON}</script></head><body></body></html>'
+    profile = _extract_from_html(html)
+    assert profile["username"] == "jane"
+    assert profile["full_name"] == "Jane Doe"
+    assert profile["biography"] == "Builds things"
+    assert profile["external_url"] == "https://jane.dev"
+
+def test_extract_from_html_ignores_other_script_types():
+    html = f'<html><head><script type="text/javascript">{LD_JSON}</script></head></html>'
+    profile = _extract_from_html(html) or {}
+    assert "full_name" not in profile
@@ -0,0 +1,91 @@
+import random
+from urllib.parse import urljoin
+
+import lxml.html
+import pytest
+
+from web_scraper import parse_portfolio, extract_links, is_valid_url, _needs_rendering
+
+URL = "https://example.com/"
+
+XML_DECLARED_PAGE = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<html><head><title>Portfolio</title></head>'
+    '<body><a class="logo">Jané Doe</a><h1>Hello</h1></body></html>'
+)
+
+@pytest.mark.parametrize("html", [XML_DECLARED_PAGE, XML_DECLARED_PAGE.encode("utf-8")])
+def test_parse_portfolio_xml_declared_page(html):
+    data = parse_portfolio(html, URL)
+    assert data.title == "Portfolio"
+    assert data.name == "Jané Doe"
+
+@pytest.mark.parametrize("html", [b"", b"  \n\t ", b"<!-- nothing here -->", "   "])
+def test_parse_portfolio_empty_page(html):
+    data = parse_portfolio(html, URL)
+    assert data.url == URL
+    assert data.name is None
+    assert data.skills == []
+
+def test_parse_portfolio_uses_header_charset():
+    html = "<html><body><a class='logo'>Jané</a></body></html>".encode("latin-1")
+    assert parse_portfolio(html, URL, encoding="iso-8859-1").name == "Jané"
+
+def test_parse_portfolio_undeclared_utf8():
+    html = "<html><body><a class='logo'>Jané</a></body></html>".encode("utf-8")
+    assert parse_portfolio(html, URL).name == "Jané"
+
+def test_parse_portfolio_meta_charset():
+    html = "<html><head><meta charset='windows-1252'></head><body><a class='logo'>Jané</a></body></html>"
+    assert parse_portfolio(html.encode("cp1252"), URL).name == "Jané"
+
+def test_needs_rendering_empty_page():
+    assert _needs_rendering(b"  <!-- shell -->  ")
+    assert not _needs_rendering(XML_DECLARED_PAGE.encode("utf-8"))
+
+def test_parse_portfolio_unknown_header_charset():
+    html = b"<html><body><a class='logo'>Jane</a></body></html>"
+    assert parse_portfolio(html, URL, encoding="not-a-charset").name == "Jane"
+
+BASE_URLS = [
+    "https://example.com",
+    "https://example.com/dir/page.html?x=1#frag",
+    "https://user:pw@example.com:8443/a/b/",
+    "http://example.com:80/",
+    "https://EXAMPLE.com/a",
+]
+
+HREFS = [
+    "", "/", "page", "a/b", "./a", "../a", "a/../b", "/a/../b", "/a/./b", "/a//b",
+    "/path/", "/path?q=1", "/path#top", "/p;params", "/x?", "/x#", "?q=1", "#frag",
+    "//cdn.example/x", "//cdn.example", "//user@cdn.example:81/x?y#z",
+    "https://other.com/x?y#z", "http://user@host/", "HTTPS://Other.com", "https:x",
+    "mailto:jane@example.com", "javascript:void(0)", " /lead", "/trail ", "/über",
+    "/a%20b", "/.", "/..", "/a/..", "//", "///x",
+]
+
+def _resolved_links(base_url, href):
+    root = lxml.html.fromstring("<div></div>")
+    lxml.html.etree.SubElement(root, "a").set("href", href)
+    return extract_links(root, base_url)
+
+def _urljoin_links(base_url, href):
+    absolute_url = urljoin(base_url, href)
+    return [absolute_url] if is_valid_url(absolute_url) else []
+
+@pytest.mark.parametrize("base_url", BASE_URLS)
+@pytest.mark.parametrize("href", HREFS)
+def test_extract_links_matches_urljoin(base_url, href):
+    assert _resolved_links(base_url, href) == _urljoin_links(base_url, href)
+
+def test_extract_links_matches_urljoin_random_hrefs():
+    rng = random.Random(0)
+    alphabet = "/./.?#;@:ab-_%~+= "
+    for _ in range(5000):
+        href = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        base_url = rng.choice(BASE_URLS)
+        try:
+            expected = _urljoin_links(base_url, href)
+        except ValueError:
+            continue  # urljoin rejects some malformed hosts outright
+        assert _resolved_links(base_url, href) == expected, (base_url, href)
@@ -1,66 +1,137 @@
+import asyncio
+import atexit
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-import json
-import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from urllib.parse import urlparse, urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
+import codecs
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
+from urllib.parse import urlparse, urljoin, urlsplit
 import re
+import threading
 from datetime import datetime
-import random
 
 class WebScraperError(Exception):
     pass
 
+def get_headers() -> Dict[str, str]:
+    """Get headers for web requests."""
+    return {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+
+# Pooled session so repeat fetches reuse keep-alive connections; rate limits
+# and transient server errors are retried with backoff
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+_session.headers.update(get_headers())
+
+# Limits for batch scraping with scrape_portfolios_async
+SCRAPE_CONCURRENCY = 64
+SCRAPE_CONNECTIONS_PER_HOST = 8
+SCRAPE_MAX_RETRIES = 3
+SCRAPE_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Pages are read in chunks and cut off past this size; lxml parses the
+# truncated document, and portfolio content sits well before that point
+MAX_PAGE_BYTES = 8 * 1024 * 1024
+PAGE_CHUNK_SIZE = 65536
+
+# scrape_portfolio's render_js='auto' only starts a browser for small static
+# pages without any of the portfolio markers, i.e. likely client-rendered shells
+RENDER_JS_MODES = ('auto', 'always', 'never')
+JS_SHELL_MAX_BYTES = 20 * 1024
+
+# A scheme followed by a non-empty network location, the same test as checking
+# urlparse's scheme and netloc without building a ParseResult per link. Leading
+# control characters and spaces are skipped the way urlparse strips them.
+_ABSOLUTE_URL_RE = re.compile(r'[\x00-\x20]*[A-Za-z][A-Za-z0-9+.-]*://[^/?#\t\n\r]')
+
+# hrefs whose resolution against an http(s) base is plain concatenation: absolute
+# or scheme-relative URLs with a host, and root-relative paths without dot or
+# empty segments. Empty queries/fragments, params, whitespace and anything else
+# urljoin would rewrite are left to urljoin.
+_SIMPLE_HREF_RE = re.compile(
+    r'(?:(?:https?:)?//[^/?#;@\[\]\x00-\x20]+(?:/[^?#;\x00-\x20]*)?'
+    r'|(?:/(?!\.\.?(?:[/?#]|$))[^/?#;\x00-\x20]+)+/?|/)'
+    r'(?:\?[^#\x00-\x20]+)?(?:#[^\x00-\x20]+)?'
+)
+
+# Social platforms in the order of their groups in _SOCIAL_RE, so a single
+# search per link identifies the platform via match.lastindex
+SOCIAL_PLATFORMS = (
+    ('github', r'github\.com'),
+    ('linkedin', r'linkedin\.com'),
+    ('twitter', r'twitter\.com'),
+    ('instagram', r'instagram\.com'),
+    ('facebook', r'facebook\.com'),
+    ('medium', r'medium\.com'),
+    ('dev.to', r'dev\.to'),
+    ('behance', r'behance\.net'),
+    ('dribbble', r'dribbble\.com')
+)
+_SOCIAL_RE = re.compile('|'.join(f'({pattern})' for _, pattern in SOCIAL_PLATFORMS), re.IGNORECASE)
+
+# Charset declared in a Content-Type header, and signs that the page declares
+# its own charset for lxml to pick up (a byte order mark or a meta tag near the top)
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
 @dataclass
 class PortfolioData:
     name: Optional[str] = None
     about: Optional[str] = None
-    skills: List[str] = None
-    experience: List[Dict] = None
-    projects: List[Dict] = None
-    education: List[Dict] = None
-    contact: Dict = None
-    social_links: Dict[str, str] = None
-    internal_links: List[str] = None
+    skills: List[str] = field(default_factory=list)
+    experience: List[Dict] = field(default_factory=list)
+    projects: List[Dict] = field(default_factory=list)
+    education: List[Dict] = field(default_factory=list)
+    contact: Dict = field(default_factory=dict)
+    social_links: Dict[str, str] = field(default_factory=dict)
+    internal_links: List[str] = field(default_factory=list)
     url: str = None
     title: str = None
     description: str = None
     scraped_at: str = None
 
-    def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-        if self.experience is None:
-            self.experience = []
-        if self.projects is None:
-            self.projects = []
-        if self.education is None:
-            self.education = []
-        if self.contact is None:
-            self.contact = {}
-        if self.social_links is None:
-            self.social_links = {}
-        if self.internal_links is None:
-            self.internal_links = []
+def _css(selector: str) -> etree.XPath:
+    """Compile a CSS selector to XPath. Like BeautifulSoup's select, it only matches descendants."""
+    return etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix='descendant::'))
 
-def get_headers() -> Dict[str, str]:
-    """Get headers for web requests."""
-    return {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+# Selectors used by parse_portfolio, compiled once so parsing and matching both stay in C
+_LOGO = _css('a.logo')
+_HERO_PARAGRAPH = _css('#hero p')
+_SKILL_IMAGES = _css('#skills .marquee-item img')
+_EXPERIENCE_ENTRIES = _css('#experience .timeline-entry')
+_EXPERIENCE_TITLE = _css('h1.font-semibold.text-3xl')
+_EXPERIENCE_DATE = _css('p.my-3.text-white-50')
+_RESPONSIBILITIES = _css('ul li.text-lg')
+_EDUCATION_BLOCKS = _css('#education [section="education"], #education .p-4.rounded-xl')
+_EDUCATION_YEARS = etree.XPath("preceding::h3[contains(concat(' ', normalize-space(@class), ' '), ' text-xl ')][1]")
+_INSTITUTION = _css('h3.text-xl.font-bold')
+_DEGREE = _css(r'p.text-neutral-600, p.dark\:text-neutral-300')
+_FOOTER_SOCIAL_LINKS = _css('footer .socials a')
+_PORTFOLIO_MARKERS = _css('#skills, #experience, h1')
 
 def is_valid_url(url: str) -> bool:
-    """Check if URL is valid."""
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except:
-        return False
+    """Check if URL is valid, i.e. has both a scheme and a network location."""
+    return _ABSOLUTE_URL_RE.match(url) is not None
 
 def normalize_url(url: str) -> str:
     """Normalize URL by adding scheme if missing."""
@@ -68,131 +139,236 @@ def normalize_url(url: str) -> str:
         url = 'https://' + url
     return url
 
-def fetch_page(url: str) -> Optional[str]:
+def _fetch_page(url: str, session: Optional[requests.Session] = None) -> Tuple[Optional[bytes], Optional[str]]:
+    """fetch_page, also returning the charset from the Content-Type header if there is one."""
+    try:
+        # The module session carries the browser headers already; a caller's session may not
+        headers = get_headers() if session is not None else None
+        with (session or _session).get(url, headers=headers, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=PAGE_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total > MAX_PAGE_BYTES:
+                    break
+            charset = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+            return b"".join(chunks), charset.group(1) if charset else None
+    except requests.RequestException as e:
+        print(f"Error fetching {url}: {e}")
+        return None, None
+
+def fetch_page(url: str, session: Optional[requests.Session] = None) -> Optional[bytes]:
     """
     Fetch the HTML content of a webpage.
     
+    The body is returned undecoded so the parser can detect its charset,
+    which skips requests' whole-body encoding detection and the extra str copy.
+    Reading stops after MAX_PAGE_BYTES, so oversized pages can't exhaust memory.
+    
     Args:
         url (str): The URL to fetch
+        session (Optional[requests.Session]): Session to reuse connections from
         
     Returns:
-        Optional[str]: The HTML content if successful, None otherwise
+        Optional[bytes]: The HTML content if successful, None otherwise
     """
+    return _fetch_page(url, session)[0]
+
+async def _fetch_page_async(session: aiohttp.ClientSession, url: str) -> Tuple[Optional[bytes], Optional[str]]:
+    """fetch_page_async, also returning the charset from the Content-Type header if there is one."""
     try:
-        response = requests.get(url, headers=get_headers(), timeout=10)
-        response.raise_for_status()
-        return response.text
-    except requests.RequestException as e:
+        for attempt in range(SCRAPE_MAX_RETRIES + 1):
+            async with session.get(url) as response:
+                if response.status in SCRAPE_RETRY_STATUSES and attempt < SCRAPE_MAX_RETRIES:
+                    await asyncio.sleep(0.3 * 2 ** attempt)
+                    continue
+                response.raise_for_status()
+                chunks = []
+                total = 0
+                async for chunk in response.content.iter_chunked(PAGE_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total > MAX_PAGE_BYTES:
+                        break
+                return b"".join(chunks), response.charset
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"Error fetching {url}: {e}")
-        return None
+        return None, None
 
-def extract_links(soup: BeautifulSoup, base_url: str) -> List[str]:
-    """Extract all links from the page."""
-    links = []
-    for a_tag in soup.find_all('a', href=True):
-        href = a_tag['href']
-        absolute_url = urljoin(base_url, href)
-        if is_valid_url(absolute_url):
-            links.append(absolute_url)
-    return links
+async def fetch_page_async(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    """
+    Fetch the HTML content of a webpage without blocking the event loop.
+    
+    Rate limits and transient server errors are retried with exponential
+    backoff, like the synchronous session's retry policy. As with fetch_page,
+    reading stops after MAX_PAGE_BYTES.
+    
+    No headers are added per request, so the session should be created with
+    get_headers() as its default headers, as scrape_portfolios_async does.
+    
+    Args:
+        session (aiohttp.ClientSession): Session to reuse connections from
+        url (str): The URL to fetch
+        
+    Returns:
+        Optional[bytes]: The HTML content if successful, None otherwise
+    """
+    return (await _fetch_page_async(session, url))[0]
 
-def extract_social_links(soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
-    """Extract social media links from the page."""
-    social_platforms = {
-        'github': r'github\.com',
-        'linkedin': r'linkedin\.com',
-        'twitter': r'twitter\.com',
-        'instagram': r'instagram\.com',
-        'facebook': r'facebook\.com',
-        'medium': r'medium\.com',
-        'dev.to': r'dev\.to',
-        'behance': r'behance\.net',
-        'dribbble': r'dribbble\.com'
-    }
+def _parse_html(html: Union[str, bytes], encoding: Optional[str] = None) -> lxml.html.HtmlElement:
+    """
+    Parse a page into an lxml tree.
+    
+    Raw bytes are parsed in the given encoding, normally the HTTP charset.
+    Without one, lxml honours a byte order mark or meta charset in the page,
+    and undeclared pages are read as UTF-8 when they are valid UTF-8.
+    
+    Raises:
+        lxml.etree.ParserError: If the page has no content, e.g. only whitespace
+    """
+    if isinstance(html, str):
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # lxml refuses str input with an XML encoding declaration
+            html, encoding = html.encode('utf-8'), 'utf-8'
+    
+    if encoding is None and not html.startswith(_BOMS) and not _META_CHARSET_RE.search(html, 0, 2048):
+        try:
+            html.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            pass
+    
+    parser = None
+    if encoding:
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            pass  # Unknown charset name in the header; let lxml detect it instead
+    return lxml.html.document_fromstring(html, parser=parser)
+
+def _text(element: lxml.html.HtmlElement) -> str:
+    """Text of an element with each string stripped, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+def _first(selector: etree.XPath, element: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+    """First match of a compiled selector under element, if any."""
+    matches = selector(element)
+    return matches[0] if matches else None
+
+def _collect_links(root: lxml.html.HtmlElement, base_url: str) -> Tuple[List[str], Dict[str, str]]:
+    """Extract all links and social media links from the page in one pass over its anchors."""
+    # Parse the base once instead of inside urljoin for every anchor
+    base = urlsplit(base_url)
+    origin = f"{base.scheme}://{base.netloc}" if base.scheme in ('http', 'https') and base.netloc else None
     
+    # Keyed by URL to drop repeats (nav, body and footer often link the same page) in page order
+    links = {}
     social_links = {}
-    for a_tag in soup.find_all('a', href=True):
-        href = a_tag['href']
-        absolute_url = urljoin(base_url, href)
+    for a_tag in root.iter('a'):
+        href = a_tag.get('href')
+        if href is None:
+            continue
+        if origin is None or not _SIMPLE_HREF_RE.fullmatch(href):
+            absolute_url = urljoin(base_url, href)
+        elif href[:1] != '/':
+            absolute_url = href
+        elif href[1:2] == '/':
+            absolute_url = f"{base.scheme}:{href}"
+        else:
+            absolute_url = origin + href
+        if is_valid_url(absolute_url):
+            links[absolute_url] = None
         
-        for platform, pattern in social_platforms.items():
-            if re.search(pattern, absolute_url, re.IGNORECASE):
-                social_links[platform] = absolute_url
-                break
+        match = _SOCIAL_RE.search(absolute_url)
+        if match:
+            social_links[SOCIAL_PLATFORMS[match.lastindex - 1][0]] = absolute_url
     
-    return social_links
+    return list(links), social_links
+
+def extract_links(root: lxml.html.HtmlElement, base_url: str) -> List[str]:
+    """Extract all distinct links from the page."""
+    return _collect_links(root, base_url)[0]
 
-def parse_portfolio(html: str, url: str) -> PortfolioData:
+def extract_social_links(root: lxml.html.HtmlElement, base_url: str) -> Dict[str, str]:
+    """Extract social media links from the page."""
+    return _collect_links(root, base_url)[1]
+
+def parse_portfolio(html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> PortfolioData:
     """
     Parse portfolio data from HTML content.
     
     Args:
-        html (str): The HTML content to parse
+        html (Union[str, bytes]): The HTML content to parse, decoded or raw
         url (str): The URL of the portfolio
+        encoding (Optional[str]): Charset of raw HTML, e.g. from the Content-Type header
         
     Returns:
-        PortfolioData: Structured portfolio data
+        PortfolioData: Structured portfolio data, empty if the page has no content
     """
-    soup = BeautifulSoup(html, 'html.parser')
     data = PortfolioData(url=url, scraped_at=datetime.now().isoformat())
+    # lxml parses in C, and the precompiled selectors run as XPath in C as well
+    try:
+        root = _parse_html(html, encoding)
+    except etree.ParserError:
+        return data
 
     # Basic metadata
-    data.title = soup.title.string if soup.title else ""
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
-    if meta_desc:
+    title = root.find('.//title')
+    data.title = title.text if title is not None else ""
+    meta_desc = root.find('.//meta[@name="description"]')
+    if meta_desc is not None:
         data.description = meta_desc.get('content', '')
 
     # Name (from header logo or h1)
-    name_tag = soup.select_one('a.logo')
-    if name_tag:
-        data.name = name_tag.get_text(strip=True)
+    name_tag = _first(_LOGO, root)
+    if name_tag is not None:
+        data.name = _text(name_tag)
     else:
-        h1_tag = soup.find('h1')
-        if h1_tag:
-            data.name = h1_tag.get_text(strip=True)
+        h1_tag = root.find('.//h1')
+        if h1_tag is not None:
+            data.name = _text(h1_tag)
 
     # About (first p in hero section)
-    about_tag = soup.select_one('#hero p')
-    if about_tag:
-        data.about = about_tag.get_text(strip=True)
-
-    # Skills
-    skills = set()
-    for img in soup.select('#skills .marquee-item img'):
-        alt = img.get('alt')
-        if alt:
-            skills.add(alt.strip())
-    data.skills = list(skills)
+    about_tag = _first(_HERO_PARAGRAPH, root)
+    if about_tag is not None:
+        data.about = _text(about_tag)
+
+    # Skills, deduplicated in page order
+    alts = (img.get('alt', '').strip() for img in _SKILL_IMAGES(root))
+    data.skills = list(dict.fromkeys(alt for alt in alts if alt))
 
     # Experience
     data.experience = []
-    for entry in soup.select('#experience .timeline-entry'):
-        title = entry.select_one('h1.font-semibold.text-3xl')
-        date = entry.select_one('p.my-3.text-white-50')
-        resp_list = entry.select('ul li.text-lg')
-        responsibilities = [li.get_text(strip=True) for li in resp_list]
+    for entry in _EXPERIENCE_ENTRIES(root):
+        title = _first(_EXPERIENCE_TITLE, entry)
+        date = _first(_EXPERIENCE_DATE, entry)
+        responsibilities = [_text(li) for li in _RESPONSIBILITIES(entry)]
         data.experience.append({
-            'title': title.get_text(strip=True) if title else None,
-            'date': date.get_text(strip=True).replace('🗓️', '').strip() if date else None,
+            'title': _text(title) if title is not None else None,
+            'date': _text(date).replace('🗓️', '').strip() if date is not None else None,
             'responsibilities': responsibilities
         })
 
     # Education
     data.education = []
-    for edu_block in soup.select('#education [section="education"], #education .p-4.rounded-xl'):
-        years = edu_block.find_previous('h3', class_='text-xl')
-        institution = edu_block.select_one('h3.text-xl.font-bold')
-        degree = edu_block.select_one('p.text-neutral-600, p.dark\:text-neutral-300')
+    for edu_block in _EDUCATION_BLOCKS(root):
+        years = _first(_EDUCATION_YEARS, edu_block)
+        institution = _first(_INSTITUTION, edu_block)
+        degree = _first(_DEGREE, edu_block)
         data.education.append({
-            'years': years.get_text(strip=True) if years else None,
-            'institution': institution.get_text(strip=True) if institution else None,
-            'degree': degree.get_text(strip=True) if degree else None
+            'years': _text(years) if years is not None else None,
+            'institution': _text(institution) if institution is not None else None,
+            'degree': _text(degree) if degree is not None else None
         })
 
-    # Contact and Social Links
+    # Contact, Social and Internal Links
     data.contact = {}
-    data.social_links = extract_social_links(soup, url)
-    for a in soup.select('footer .socials a'):
+    data.internal_links, data.social_links = _collect_links(root, url)
+    for a in _FOOTER_SOCIAL_LINKS(root):
         href = a.get('href')
         if not href:
             continue
@@ -203,15 +379,56 @@ def parse_portfolio(html: str, url: str) -> PortfolioData:
         elif 'x.com' in href or 'twitter' in href:
             data.contact['twitter'] = href
 
-    # Internal Links
-    data.internal_links = extract_links(soup, url)
-
     return data
 
+# Playwright's sync API is bound to the thread that started it, so all browser
+# work runs on this one thread and the launched browser is reused between pages
+_playwright_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+_playwright = None
+_browser = None
+
+def _render_page(url: str) -> str:
+    """Load a page in the shared browser, launching it first if needed. Runs on _playwright_executor."""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        if _playwright is None:
+            from playwright.sync_api import sync_playwright
+            _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(headless=True, args=['--no-sandbox', '--disable-setuid-sandbox'])
+    
+    # Each page gets its own short-lived context, so no cookies or storage leak between sites
+    page = _browser.new_page()
+    try:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        # Wait for JS to render, but only as long as the page is still busy,
+        # and keep whatever has rendered if it never settles
+        try:
+            page.wait_for_load_state('networkidle', timeout=5000)
+            page.wait_for_selector('#skills, #experience, h1', timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
+        return page.content()
+    finally:
+        page.close()
+
+def _close_browser() -> None:
+    """Shut down the shared browser and Playwright. Runs on _playwright_executor."""
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
 def fetch_with_playwright(url: str) -> Optional[str]:
     """
     Fetch webpage content using Playwright for JavaScript-heavy sites.
     
+    The browser is launched on first use and kept for later calls; see
+    close_playwright.
+    
     Args:
         url (str): The URL to fetch
         
@@ -219,15 +436,7 @@ def fetch_with_playwright(url: str) -> Optional[str]:
         Optional[str]: The HTML content if successful, None otherwise
     """
     try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-setuid-sandbox'])
-            page = browser.new_page()
-            page.goto(url)
-            time.sleep(2)  # Wait for JS to load
-            html = page.content()
-            browser.close()
-            return html
+        return _playwright_executor.submit(_render_page, url).result()
     except ImportError:
         print("Playwright not installed. Please install it using: pip install playwright and then playwright install")
         return None
@@ -235,6 +444,17 @@ def fetch_with_playwright(url: str) -> Optional[str]:
         print(f"Error using Playwright: {e}")
         return None
 
+def close_playwright() -> None:
+    """Close the browser kept by fetch_with_playwright, if one was launched."""
+    if _playwright is None and _browser is None:
+        return
+    _playwright_executor.submit(_close_browser).result()
+
+# Close the browser at exit even if close_playwright is never called. atexit
+# handlers run after concurrent.futures has stopped accepting work, so this
+# uses threading's exit hooks, which run first, like concurrent.futures itself.
+getattr(threading, "_register_atexit", atexit.register)(close_playwright)
+
 def save_to_json(data: PortfolioData, filename: str = "portfolio_data.json") -> None:
     """
     Save portfolio data to a JSON file.
@@ -244,44 +464,109 @@ def save_to_json(data: PortfolioData, filename: str = "portfolio_data.json") ->
         filename (str): The output filename
     """
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data.__dict__, f, indent=4, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data.__dict__, option=orjson.OPT_INDENT_2))
         print(f"✅ Data saved to '{filename}'")
     except Exception as e:
         print(f"❌ Error saving data: {e}")
 
-def scrape_portfolio(url: str) -> PortfolioData:
+def _needs_rendering(html: Optional[bytes], encoding: Optional[str] = None) -> bool:
+    """Tell whether a statically fetched page is missing or looks like a JavaScript shell."""
+    if not html:
+        return True
+    if len(html) >= JS_SHELL_MAX_BYTES:
+        return False
+    try:
+        return _first(_PORTFOLIO_MARKERS, _parse_html(html, encoding)) is None
+    except etree.ParserError:
+        return True
+
+def scrape_portfolio(url: str, session: Optional[requests.Session] = None, render_js: str = 'auto') -> PortfolioData:
     """
     Scrape portfolio website data.
     
     Args:
         url (str): Portfolio website URL
+        session (Optional[requests.Session]): Session to reuse connections from
+        render_js (str): When to load the page in Playwright: 'auto' only if
+            the plain fetch fails or returns a small page without portfolio
+            content, 'always' before the plain fetch, or 'never'
         
     Returns:
         PortfolioData: Structured portfolio information
     """
+    if render_js not in RENDER_JS_MODES:
+        raise ValueError(f"render_js must be one of {RENDER_JS_MODES}, got {render_js!r}")
+    
     try:
         # Normalize URL
         url = normalize_url(url)
         
-        # Add random delay to avoid rate limiting
-        time.sleep(random.uniform(1, 3))
-        
-        # Try Playwright first for JavaScript-heavy sites
-        html = fetch_with_playwright(url)
-        
-        # Fallback to regular requests if Playwright fails
-        if not html:
-            html = fetch_page(url)
+        # Static sites are served by a plain request; a browser is only
+        # started for pages that need JavaScript to render
+        # Rendered pages come back as str, so only fetched bytes carry a charset
+        encoding = None
+        if render_js == 'always':
+            html = fetch_with_playwright(url)
+            if not html:
+                html, encoding = _fetch_page(url, session)
+        else:
+            html, encoding = _fetch_page(url, session)
+            if render_js == 'auto' and _needs_rendering(html, encoding):
+                rendered = fetch_with_playwright(url)
+                if rendered:
+                    html, encoding = rendered, None
             
         if not html:
             raise WebScraperError("Failed to fetch webpage content")
             
-        return parse_portfolio(html, url)
+        return parse_portfolio(html, url, encoding)
         
     except Exception as e:
         raise WebScraperError(f"Error scraping portfolio: {str(e)}")
 
+async def scrape_portfolios_async(urls: List[str]) -> List[Optional[PortfolioData]]:
+    """
+    Scrape many portfolio websites concurrently.
+    
+    Pages are fetched over one pooled aiohttp session, at most
+    SCRAPE_CONCURRENCY at a time, and parsed in worker threads. Unlike
+    scrape_portfolio there is no Playwright fallback, so JavaScript-rendered
+    sites yield only their static HTML.
+    
+    Args:
+        urls (List[str]): Portfolio website URLs
+        
+    Returns:
+        List of PortfolioData, or None where a page couldn't be fetched or
+        parsed, in the same order as urls
+    """
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    
+    async def scrape_one(session: aiohttp.ClientSession, url: str) -> Optional[PortfolioData]:
+        url = normalize_url(url)
+        async with semaphore:
+            html, encoding = await _fetch_page_async(session, url)
+        if not html:
+            return None
+        try:
+            return await asyncio.to_thread(parse_portfolio, html, url, encoding)
+        except Exception as e:
+            print(f"Error parsing {url}: {e}")
+            return None
+    
+    connector = aiohttp.TCPConnector(
+        limit=SCRAPE_CONCURRENCY,
+        limit_per_host=SCRAPE_CONNECTIONS_PER_HOST,
+        keepalive_timeout=30
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers=get_headers()  # Sent with every request without rebuilding them per fetch
+    ) as session:
+        return list(await asyncio.gather(*(scrape_one(session, url) for url in urls)))
+
 def main():
     """Main execution function."""
     portfolio_url = "https://yuva-sri-ramesh-portfolio.vercel.app/"
@@ -300,6 +585,8 @@ def main():
         
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        close_playwright()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file